@@ -1,11 +1,20 @@
 import os
 import sys
 import json
+import logging
 import time
 import threading
-from typing import Dict, List, Tuple, Optional
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Set, Tuple, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from rich.console import Console
+from rich.logging import RichHandler
 from rich.panel import Panel
 
 from libs.config import Config
@@ -15,19 +24,30 @@ from libs.vod_downloader import VodDownloader
 from libs.step_logger import StepLogger
 
 
-def _debug(message: str, console: Optional[Console] = None) -> None:
-    if Config.DEBUG_VERBOSE:
-        if console:
-            try:
-                console.log(f"[debug] {message}")
-                return
-            except Exception:
-                pass
-        print(f"[debug] {message}")
+log = logging.getLogger("kick")
+
+
+def _configure_logging(console: Console) -> None:
+    handler = RichHandler(console=console, show_path=False)
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG if Config.DEBUG_VERBOSE else logging.INFO)
+    log.propagate = False
 
 
 STATE_LOCK = threading.Lock()
 STATE_RETENTION = 200
+STATE_FILE = "_state.log"
+LEGACY_STATE_FILE = "_state.json"
+STATE_COMPACT_RATIO = 10  # Rewrite the log once it holds this many lines per retained entry
+PREFETCH_AHEAD = 2  # Pending VODs whose metadata is resolved while the current one downloads
+# In-memory copy of the state log; loaded once under STATE_LOCK, then each
+# channel's entry is guarded by its own lock so workers never contend
+_STATE_CACHE: Optional[Dict[str, List[str]]] = None
+_CHANNEL_LOCKS: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+_locks_mu = threading.Lock()
+_state_log_lines = 0
+# Serializes appends to and compaction of the state log
+_STATE_WRITE_LOCK = threading.Lock()
 
 
 def _env_bool(name: str, default: bool) -> bool:
@@ -37,54 +57,145 @@ def _env_bool(name: str, default: bool) -> bool:
     return v.strip().lower() in ("1", "true", "yes", "y", "on")
 
 
+def _encode_entry(channel: str, uuid: str, ts: int) -> bytes:
+    entry = {"ch": channel, "uuid": uuid, "ts": ts}
+    if orjson:
+        return orjson.dumps(entry) + b"\n"
+    return (json.dumps(entry, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _decode_entry(line: bytes):
+    return orjson.loads(line) if orjson else json.loads(line)
+
+
 def _load_state(path: str) -> Dict[str, List[str]]:
+    """Rebuild per-channel history from the append-only state log."""
+    histories: Dict[str, List[str]] = {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = _decode_entry(line)
+                except ValueError:
+                    # Torn write from an interrupted append
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+                channel, uuid = entry.get("ch"), entry.get("uuid")
+                if isinstance(channel, str) and isinstance(uuid, str):
+                    histories.setdefault(channel, []).append(uuid)
+    except OSError:
+        pass
+    return {channel: _normalize_history(history) for channel, history in histories.items()}
+
+
+def _load_legacy_state(path: str) -> Dict[str, List[str]]:
+    try:
+        with open(path, "rb") as f:
+            data = _decode_entry(f.read())
     except Exception:
         return {}
+    if not isinstance(data, dict):
+        return {}
+    return {channel: _normalize_history(history) for channel, history in data.items() if isinstance(channel, str)}
 
 
-def _save_state(path: str, data: Dict[str, List[str]]) -> None:
+def _save_state(path: str, data: Dict[str, List[str]]) -> int:
+    """Atomically rewrite the state log from data; returns the number of lines written."""
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    ts = int(time.time())
+    lines = 0
+    with open(tmp, "wb") as f:
+        for channel, history in data.items():
+            for uuid in history:
+                f.write(_encode_entry(channel, uuid, ts))
+                lines += 1
     os.replace(tmp, path)
+    return lines
+
+
+def _compact_state(state_path: str) -> None:
+    # Caller must hold _STATE_WRITE_LOCK
+    global _state_log_lines
+    snapshot = {channel: list(history) for channel, history in list((_STATE_CACHE or {}).items())}
+    _state_log_lines = _save_state(state_path, snapshot)
+    log.debug("state log compacted to %d entries", _state_log_lines)
+
+
+def _append_state_entry(state_path: str, channel: str, uuid: str) -> None:
+    global _state_log_lines
+    with _STATE_WRITE_LOCK:
+        try:
+            with open(state_path, "ab") as f:
+                f.write(_encode_entry(channel, uuid, int(time.time())))
+            _state_log_lines += 1
+            retained = sum(len(history) for history in list((_STATE_CACHE or {}).values()))
+            if _state_log_lines > STATE_COMPACT_RATIO * max(retained, 1):
+                _compact_state(state_path)
+        except OSError as e:
+            log.debug("state append failed: %s", e)
 
 
 def _normalize_history(history) -> List[str]:
-    if isinstance(history, list):
-        values = history
-    elif isinstance(history, str):
+    if isinstance(history, str):
         values = [history]
+    elif isinstance(history, list):
+        values = [item for item in history if isinstance(item, str)]
     else:
         values = []
-    seen = set()
-    ordered: List[str] = []
-    for item in values:
-        if not isinstance(item, str):
-            continue
-        if item in seen:
-            continue
-        ordered.append(item)
-        seen.add(item)
-    return ordered[-STATE_RETENTION:]
+    # dict.fromkeys dedupes while keeping first-seen order
+    return list(dict.fromkeys(values))[-STATE_RETENTION:]
+
+
+def _ensure_state_loaded(state_path: str) -> Dict[str, List[str]]:
+    global _STATE_CACHE, _state_log_lines
+    if _STATE_CACHE is None:
+        with STATE_LOCK:
+            if _STATE_CACHE is None:
+                legacy_path = os.path.join(os.path.dirname(state_path), LEGACY_STATE_FILE)
+                if not os.path.exists(state_path) and os.path.exists(legacy_path):
+                    # One-time migration from the old whole-file JSON state
+                    state = _load_legacy_state(legacy_path)
+                else:
+                    state = _load_state(state_path)
+                # Compact on startup; this also drops any torn trailing line
+                with _STATE_WRITE_LOCK:
+                    _state_log_lines = _save_state(state_path, state)
+                _STATE_CACHE = state
+    return _STATE_CACHE
+
+
+def _channel_lock(channel: str) -> threading.Lock:
+    with _locks_mu:
+        return _CHANNEL_LOCKS[channel]
 
 
 def _get_channel_history(state_path: str, channel: str) -> List[str]:
-    with STATE_LOCK:
-        state = _load_state(state_path)
-        history = state.get(channel)
-    return _normalize_history(history)
+    state = _ensure_state_loaded(state_path)
+    with _channel_lock(channel):
+        return list(state.get(channel, ()))
+
 
+def _append_channel_history(state_path: str, channel: str, uuid: str) -> None:
+    state = _ensure_state_loaded(state_path)
+    with _channel_lock(channel):
+        history = state.setdefault(channel, [])
+        if uuid in history:
+            return
+        history.append(uuid)
+        del history[:-STATE_RETENTION]
+    _append_state_entry(state_path, channel, uuid)
 
-def _set_channel_history(state_path: str, channel: str, history: List[str]) -> List[str]:
-    normalized = _normalize_history(history)
-    with STATE_LOCK:
-        state = _load_state(state_path)
-        state[channel] = normalized
-        _save_state(state_path, state)
-    return normalized
+
+def _existing_mp3_names(directory: str) -> Set[str]:
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.name.endswith(".mp3")}
+    except OSError:
+        return set()
 
 
 def _list_channel_vods(vd: VodDownloader, channel: str) -> List[Tuple[str, str]]:
@@ -110,26 +221,43 @@ def _list_channel_vods(vd: VodDownloader, channel: str) -> List[Tuple[str, str]]
     return items
 
 
+def _prefetch_vod(vd: VodDownloader, uuid: str) -> Tuple[Optional[dict], Optional[str]]:
+    try:
+        return vd.get_video_metadata_by_uuid(uuid), vd.get_video_master_m3u8_by_uuid(uuid)
+    except Exception:
+        return None, None
+
+
 def _worker(channel: str, quality: str, poll_seconds: int, live_check_seconds: int, state_path: str, console: Console) -> None:
     steps = StepLogger(console)
     fm = FileManager()
 
+    vd = VodDownloader(driver=None, console=console, file_manager=fm, step_logger=steps)
+    # Overlap connection setup to the API/CDN hosts with the (slow) Chrome startup
+    vd.prewarm_connections()
+
     driver = WebDriverManager(console).setup()
     if not driver:
         console.print(f"[bold red]Failed to init WebDriver for {channel}[/bold red]")
         return
-
-    vd = VodDownloader(driver=driver, console=console, file_manager=fm, step_logger=steps)
+    vd.driver = driver
+    # Single worker: lookups go through the (non thread-safe) driver, so they may
+    # only overlap with the download, never with each other
+    prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"prefetch-{channel}")
 
     try:
         console.print(Panel(f"[cyan]Watching channel:[/cyan] [bold]{channel}[/bold]", title="Worker", border_style="cyan"))
-        _debug(f"{channel}: worker started", console)
+        log.debug("%s: worker started", channel)
 
         history = _get_channel_history(state_path, channel)
         processed = set(history)
         queue_step_id = steps.start_step(f"{channel}: backlog", detail="initializing")
         current_task: Optional[str] = None
-        _debug(f"{channel}: loaded history entries -> {len(history)}", console)
+        remaining_pending = 0
+        last_top_uuid: Optional[str] = None
+        prefetched: Dict[str, Future] = {}
+        dl_dir = Config.DOWNLOAD_DIR
+        log.debug("%s: loaded history entries -> %d", channel, len(history))
 
         def update_queue_detail(pending_count: int, status: str) -> None:
             summary = f"pending: {pending_count}, processed: {len(processed)}"
@@ -138,85 +266,104 @@ def _worker(channel: str, quality: str, poll_seconds: int, live_check_seconds: i
             elif status:
                 summary += f", status: {status}"
             steps.set_detail(queue_step_id, summary)
-            _debug(f"{channel}: backlog status -> {summary}", console)
+            log.debug("%s: backlog status -> %s", channel, summary)
 
-        def record_processed(uuid: str, pending_after: int) -> None:
-            nonlocal history, processed, current_task
+        def record_processed(uuid: str) -> None:
+            nonlocal current_task, remaining_pending
             if uuid in processed:
                 return
-            history.append(uuid)
-            history = _set_channel_history(state_path, channel, history)
-            processed = set(history)
+            _append_channel_history(state_path, channel, uuid)
+            processed.add(uuid)
+            remaining_pending = max(remaining_pending - 1, 0)
             current_task = None
-            update_queue_detail(pending_after, "idle")
-            _debug(f"{channel}: recorded VOD {uuid} as processed", console)
+            update_queue_detail(remaining_pending, "idle")
+            log.debug("%s: recorded VOD %s as processed", channel, uuid)
 
         while True:
+            if last_top_uuid and remaining_pending == 0:
+                # Nothing left over from the last poll: probe the newest VOD without the browser
+                # and skip the full listing while it is unchanged. A blocked probe lists as usual
+                latest = vd.get_latest_vod_link(channel, use_browser=False)
+                if latest and vd._parse_uuid_from_vod_url(latest) == last_top_uuid:
+                    log.debug("%s: poll -> newest VOD unchanged (%s)", channel, last_top_uuid)
+                    update_queue_detail(0, "idle")
+                    time.sleep(live_check_seconds)
+                    continue
             vod_items = _list_channel_vods(vd, channel)
-            pending_list = [u for u, _ in vod_items if u not in processed]
-            _debug(f"{channel}: poll -> total VODs {len(vod_items)}, pending {len(pending_list)}", console)
-            if not vod_items or not pending_list:
+            last_top_uuid = vod_items[0][0] if vod_items else None
+            pending_items = [(u, p) for u, p in vod_items if u not in processed]
+            remaining_pending = len(pending_items)
+            log.debug("%s: poll -> total VODs %d, pending %d", channel, len(vod_items), remaining_pending)
+            if not pending_items:
                 update_queue_detail(0, "idle")
                 time.sleep(live_check_seconds)
                 continue
 
-            update_queue_detail(len(pending_list), "ready")
+            update_queue_detail(remaining_pending, "ready")
             downloaded_any = False
+            existing_mp3 = _existing_mp3_names(dl_dir)
 
-            for uuid, vod_page in vod_items:
-                if uuid in processed:
-                    _debug(f"{channel}: skipping already processed VOD {uuid}", console)
-                    continue
+            for idx, (uuid, vod_page) in enumerate(pending_items):
+                # Make sure no prefetch is using the driver before this thread does
+                if prefetched:
+                    wait(list(prefetched.values()))
+                future = prefetched.pop(uuid, None)
+                prefetched_meta, prefetched_master = future.result() if future else (None, None)
 
-                meta = vd.get_video_metadata_by_uuid(uuid)
+                # Repeat lookups are served from the downloader's bounded video JSON cache
+                meta = prefetched_meta or vd.get_video_metadata_by_uuid(uuid)
                 basename = vd.build_suggested_basename(channel, meta, quality)
-                mp3_target = os.path.join(Config.DOWNLOAD_DIR, f"{basename}.mp3")
 
                 current_task = basename
-                pending_now = len([u for u, _ in vod_items if u not in processed])
-                update_queue_detail(pending_now, "downloading")
-                _debug(f"{channel}: preparing download for {basename} (uuid {uuid})", console)
+                update_queue_detail(remaining_pending, "downloading")
+                log.debug("%s: preparing download for %s (uuid %s)", channel, basename, uuid)
 
-                if os.path.exists(mp3_target):
+                if f"{basename}.mp3" in existing_mp3:
                     console.print(f"[green]{channel}[/green]: {basename} already exists; skipping")
-                    pending_after_skip = len([u for u, _ in vod_items if u not in processed and u != uuid])
-                    record_processed(uuid, pending_after_skip)
-                    _debug(f"{channel}: file already exists at {mp3_target}; skip", console)
+                    record_processed(uuid)
+                    log.debug("%s: %s.mp3 already exists in %s; skip", channel, basename, dl_dir)
                     continue
 
                 with steps.step(f"{channel}: resolve {uuid[:8]}") as set_detail:
                     set_detail("fetching master playlist")
-                    master = vd.get_video_master_m3u8_by_uuid(uuid)
+                    master = prefetched_master or vd.get_video_master_m3u8_by_uuid(uuid)
                     if not master:
                         set_detail("master m3u8 missing; retry later")
                         current_task = None
-                        _debug(f"{channel}: missing master playlist for {uuid}", console)
+                        log.debug("%s: missing master playlist for %s", channel, uuid)
                         continue
                     set_detail("selecting variant")
                     variant = vd._derive_variant_from_master_url(master, quality)
                     if not variant:
                         set_detail("variant m3u8 missing; retry later")
                         current_task = None
-                        _debug(f"{channel}: unable to derive variant for {uuid}", console)
+                        log.debug("%s: unable to derive variant for %s", channel, uuid)
                         continue
-                    _debug(f"{channel}: resolved variant playlist {variant}", console)
+                    log.debug("%s: resolved variant playlist %s", channel, variant)
+
+                for next_uuid, _ in pending_items[idx + 1:idx + 1 + PREFETCH_AHEAD]:
+                    if next_uuid not in prefetched:
+                        prefetched[next_uuid] = prefetch_pool.submit(_prefetch_vod, vd, next_uuid)
 
                 with steps.step(f"{channel}: download {basename}") as set_detail:
                     set_detail("downloading segments")
-                    _debug(f"{channel}: starting download_vod_from_m3u8 for {basename}", console)
+                    log.debug("%s: starting download_vod_from_m3u8 for %s", channel, basename)
                     mp3_path = vd.download_vod_from_m3u8(variant, output_basename=basename)
                     if not mp3_path:
                         set_detail("download failed")
                         current_task = None
-                        _debug(f"{channel}: download failed for {basename}", console)
+                        log.debug("%s: download failed for %s", channel, basename)
                         continue
                     set_detail(f"saved {mp3_path}")
-                    _debug(f"{channel}: download completed -> {mp3_path}", console)
+                    log.debug("%s: download completed -> %s", channel, mp3_path)
 
-                pending_after = len([u for u, _ in vod_items if u not in processed and u != uuid])
-                record_processed(uuid, pending_after)
+                record_processed(uuid)
                 downloaded_any = True
 
+            if prefetched:
+                wait(list(prefetched.values()))
+                prefetched.clear()
+
             if not downloaded_any:
                 time.sleep(live_check_seconds)
             else:
@@ -225,6 +372,7 @@ def _worker(channel: str, quality: str, poll_seconds: int, live_check_seconds: i
     except KeyboardInterrupt:
         pass
     finally:
+        prefetch_pool.shutdown(wait=True, cancel_futures=True)
         WebDriverManager(console).close(driver)
         steps.stop()
 
@@ -241,7 +389,8 @@ if __name__ == "__main__":
     debug_verbose = _env_bool("DEBUG_VERBOSE", False)
     if debug_verbose:
         Config.DEBUG_VERBOSE = True
-        _debug("Verbose debug logging enabled", console)
+    _configure_logging(console)
+    log.debug("Verbose debug logging enabled")
 
     # Get channels from env or config, handling empty strings
     channels_str = os.getenv("CHANNELS", "").strip()
@@ -260,7 +409,7 @@ if __name__ == "__main__":
     live_check_seconds = int(os.getenv("LIVE_CHECK_SECONDS", "60"))
     os.makedirs(Config.DOWNLOAD_DIR, exist_ok=True)
 
-    state_path = os.path.join(Config.DOWNLOAD_DIR, "_state.json")
+    state_path = os.path.join(Config.DOWNLOAD_DIR, STATE_FILE)
     console.print(Panel(f"[bold green]Kick Auto Downloader[/bold green]\nDir: {Config.DOWNLOAD_DIR}\nChannels: {', '.join(channels)}\nQuality: {quality}", title="Init", border_style="green"))
 
     threads = []
@@ -270,7 +419,10 @@ if __name__ == "__main__":
         t.start()
 
     try:
-        while any(t.is_alive() for t in threads):
-            time.sleep(5)
+        for t in threads:
+            # Join with a long timeout so Ctrl+C is still delivered on platforms
+            # where an untimed join blocks signals
+            while t.is_alive():
+                t.join(timeout=60)
     except KeyboardInterrupt:
         console.print("\n[bold yellow]Shutting down…[/bold yellow]")
@@ -52,9 +52,30 @@ if __name__ == "__main__":
         default=None,
         help="Preferred quality substring, e.g. '480p30' or '720p30' when using --live-channel"
     )
+    parser.add_argument(
+        "--persistent-browser",
+        action="store_true",
+        help="Keep Chrome running after exit and reuse it on the next run (skips browser startup)"
+    )
+    parser.add_argument(
+        "--close-browser",
+        action="store_true",
+        help="Stop the browser kept running by --persistent-browser and exit"
+    )
 
     args = parser.parse_args()
 
+    if args.close_browser:
+        console = Console()
+        if WebDriverManager(console).kill_persistent():
+            console.print("[green]Persistent browser stopped.[/green]")
+        else:
+            console.print("[yellow]No persistent browser running.[/yellow]")
+        sys.exit(0)
+
+    if args.persistent_browser:
+        Config.PERSISTENT_BROWSER = True
+
     # If a live channel is specified, resolve its m3u8 first and stream (always via Selenium to bypass CF)
     if args.live_channel:
         console = Console()
@@ -69,13 +90,16 @@ if __name__ == "__main__":
             with steps.step("Initialize file manager"):
                 fm = FileManager()
 
+            with steps.step("Create downloader instance"):
+                vd = VodDownloader(driver=None, console=console, file_manager=fm, step_logger=steps)
+                # Overlap connection setup to the API/CDN hosts with the (slow) Chrome startup
+                vd.prewarm_connections()
+
             with steps.step("Initialize WebDriver"):
                 driver = WebDriverManager(console).setup()
                 if not driver:
                     raise RuntimeError("WebDriver initialization failed")
-
-            with steps.step("Create downloader instance"):
-                vd = VodDownloader(driver=driver, console=console, file_manager=fm, step_logger=steps)
+                vd.driver = driver
 
             # Strict strategy: DO NOT use live playback m3u8; always use latest VOD → v1 video API → variant
             variant = args.live_quality or '480p30'
@@ -4,13 +4,19 @@ from selenium.webdriver.chrome.options import Options
 class Config:
     # Download settings
     DOWNLOAD_DIR = os.path.join(os.getcwd(), "kick_vod_downloads")
+    SEGMENT_CONCURRENCY = 8  # Parallel HLS segment downloads per VOD
+    USE_HTTP2_SEGMENTS = False  # Opt-in: download segments over HTTP/2 with httpx when it is installed
 
     # FFmpeg settings
     CONVERT_TO_MP3 = True
+    USE_FFMPEG_HLS = False  # Opt-in: let ffmpeg fetch the HLS playlist itself; falls back to manual segment download
     DELETE_ORIGINAL_AFTER_CONVERT = False
 
     TARGET_CHANNEL = ""
 
+    # Browser settings
+    PERSISTENT_BROWSER = False  # Keep one Chrome running across runs and attach to it instead of relaunching
+
     # Debug
     DEBUG_HTTP = False
     DEBUG_VERBOSE = False
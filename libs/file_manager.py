@@ -1,10 +1,45 @@
+import atexit
 import os
+import queue
+import threading
 import time
+from typing import Optional, Tuple
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from rich import print
 
 from .config import Config
 
+# Page sources can be several MB; they are written by a background thread so
+# error paths don't block the calling worker on disk I/O
+_write_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _writer_loop() -> None:
+    while True:
+        path, data = _write_queue.get()
+        try:
+            with open(path, 'wb') as f:
+                f.write(data)
+            print(f"[cyan]Saved debug page source:[/cyan] {path}")
+        except Exception as write_e:
+            print(f"[bold red]Error saving debug info:[/bold red] {write_e}")
+        finally:
+            _write_queue.task_done()
+
+
+def _enqueue_write(path: str, data: bytes) -> None:
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="debug-writer", daemon=True)
+            _writer_thread.start()
+            # Let queued writes finish before the interpreter exits
+            atexit.register(_write_queue.join)
+    _write_queue.put((path, data))
+
+
 class FileManager:
     def __init__(self):
         os.makedirs(Config.DOWNLOAD_DIR, exist_ok=True)
@@ -24,17 +59,15 @@ class FileManager:
             else:
                 sanitized_vod_url = vod_url.replace(':', '_').replace('/', '_')
 
-            filename_base = f'{prefix}_{sanitized_vod_url}_{timestamp}'
+            path_base = f'{Config.DOWNLOAD_DIR}{os.sep}{prefix}_{sanitized_vod_url}_{timestamp}'
 
-            screenshot_path = os.path.join(Config.DOWNLOAD_DIR, f'{filename_base}_screenshot.png')
-            page_source_path = os.path.join(Config.DOWNLOAD_DIR, f'{filename_base}_page_source.html')
+            screenshot_path = f'{path_base}_screenshot.png'
+            page_source_path = f'{path_base}_page_source.html'
 
             driver_instance.save_screenshot(screenshot_path)
             print(f"[cyan]Saved debug screenshot:[/cyan] {screenshot_path}")
 
-            with open(page_source_path, 'w', encoding='utf-8') as f:
-                f.write(driver_instance.page_source)
-            print(f"[cyan]Saved debug page source:[/cyan] {page_source_path}")
+            _enqueue_write(page_source_path, driver_instance.page_source.encode('utf-8'))
 
         except Exception as debug_e:
             print(f"[bold red]Error saving debug info:[/bold red] {debug_e}")
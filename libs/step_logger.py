@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Optional, Dict
@@ -11,6 +13,28 @@ from rich.table import Table
 from rich.text import Text
 
 
+# Static status prefixes are shared across renders; only the spinner needs a fresh instance
+_CHECK = Text("✔", style="bold green")
+_CROSS = Text("✖", style="bold red")
+_SKIP = Text("↷", style="yellow")
+_BULLET = Text("•", style="dim")
+_EMPTY = Text("")
+
+_PENDING_STYLE = (lambda: _BULLET, "dim")
+_STATUS_STYLES = {
+    "running": (lambda: Spinner("dots", text=""), "bold cyan"),
+    "done": (lambda: _CHECK, "green"),
+    "error": (lambda: _CROSS, "red"),
+    "skipped": (lambda: _SKIP, "yellow"),
+    "pending": _PENDING_STYLE,
+}
+
+
+# Upper bound on tracked steps; the oldest finished ones are evicted first
+MAX_STEPS = 100
+_FINISHED = ("done", "skipped", "error")
+
+
 @dataclass
 class Step:
     title: str
@@ -21,30 +45,47 @@ class Step:
 class StepLogger:
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
-        self.steps: Dict[int, Step] = {}
+        # Insertion order matches step ids, so the oldest step is always first
+        self.steps: Dict[int, Step] = OrderedDict()
         self._next_id: int = 1
         self._live: Optional[Live] = None
+        # Keep at most this many finished (done/skipped) steps on screen
+        self._completed_trim: int = 50
+        # Renders happen on Live's refresh thread; structural changes (new, pruned
+        # or re-styled steps) mark dirty, detail updates edit the cached Text in place
+        self._lock = threading.RLock()
+        self._dirty: bool = True
+        self._renderable = None
+        self._detail_texts: Dict[int, Text] = {}
+
+    def _get_renderable(self):
+        with self._lock:
+            if self._dirty or self._renderable is None:
+                self._renderable = self._render()
+                self._dirty = False
+            return self._renderable
+
+    def _mark_dirty(self):
+        self._dirty = True
+
+    def _prune(self):
+        completed = [idx for idx, step in self.steps.items() if step.status in ("done", "skipped")]
+        for idx in completed[:max(len(completed) - self._completed_trim, 0)]:
+            del self.steps[idx]
+        excess = len(self.steps) - MAX_STEPS
+        if excess > 0:
+            stale = [idx for idx, step in self.steps.items() if step.status in _FINISHED]
+            for idx in stale[:excess]:
+                del self.steps[idx]
 
     def _render(self):
+        self._detail_texts = {}
         table = Table.grid(padding=(0, 1))
         table.expand = True
-        for idx in sorted(self.steps.keys()):
-            step = self.steps[idx]
-            if step.status == "running":
-                prefix = Spinner("dots", text="")
-                title = Text(step.title, style="bold cyan")
-            elif step.status == "done":
-                prefix = Text("✔", style="bold green")
-                title = Text(step.title, style="green")
-            elif step.status == "error":
-                prefix = Text("✖", style="bold red")
-                title = Text(step.title, style="red")
-            elif step.status == "skipped":
-                prefix = Text("↷", style="yellow")
-                title = Text(step.title, style="yellow")
-            else:
-                prefix = Text("•", style="dim")
-                title = Text(step.title, style="dim")
+        for step_id, step in self.steps.items():
+            prefix_factory, title_style = _STATUS_STYLES.get(step.status, _PENDING_STYLE)
+            prefix = prefix_factory()
+            title = Text(step.title, style=title_style)
 
             row = Table.grid()
             row.add_column(width=2)
@@ -52,58 +93,67 @@ class StepLogger:
             row.add_row(prefix, title)
             if step.detail:
                 detail_text = Text(step.detail, style="dim")
-                row.add_row(Text(""), detail_text)
+                self._detail_texts[step_id] = detail_text
+                row.add_row(_EMPTY, detail_text)
             table.add_row(row)
         return Panel(table, title="Progress", border_style="cyan")
 
     def _ensure_live(self):
         if self._live is None:
-            self._live = Live(self._render(), console=self.console, refresh_per_second=10)
+            # Live polls get_renderable at refresh_per_second; no explicit updates needed
+            self._live = Live(console=self.console, refresh_per_second=10, get_renderable=self._get_renderable)
             self._live.start()
-        else:
-            self._live.update(self._render())
 
     def start_step(self, title: str, detail: Optional[str] = None) -> int:
-        step_id = self._next_id
-        self._next_id += 1
-        self.steps[step_id] = Step(title=title, status="running", detail=detail)
+        with self._lock:
+            step_id = self._next_id
+            self._next_id += 1
+            self.steps[step_id] = Step(title=title, status="running", detail=detail)
+            self._mark_dirty()
         self._ensure_live()
-        self._live.update(self._render())
         return step_id
 
     def set_detail(self, step_id: int, detail: Optional[str]):
-        step = self.steps.get(step_id)
-        if step:
-            step.detail = detail
-            if self._live:
-                self._live.update(self._render())
+        with self._lock:
+            step = self.steps.get(step_id)
+            if step:
+                step.detail = detail
+                detail_text = self._detail_texts.get(step_id)
+                if detail and detail_text is not None and not self._dirty:
+                    detail_text.plain = detail
+                else:
+                    # Detail line appears or disappears: the row layout changes
+                    self._mark_dirty()
 
     def complete_step(self, step_id: int, detail: Optional[str] = None):
-        step = self.steps.get(step_id)
-        if step:
-            step.status = "done"
-            if detail is not None:
-                step.detail = detail
-            if self._live:
-                self._live.update(self._render())
+        with self._lock:
+            step = self.steps.get(step_id)
+            if step:
+                step.status = "done"
+                if detail is not None:
+                    step.detail = detail
+                self._prune()
+                self._mark_dirty()
 
     def error_step(self, step_id: int, detail: Optional[str] = None):
-        step = self.steps.get(step_id)
-        if step:
-            step.status = "error"
-            if detail is not None:
-                step.detail = detail
-            if self._live:
-                self._live.update(self._render())
+        with self._lock:
+            step = self.steps.get(step_id)
+            if step:
+                step.status = "error"
+                if detail is not None:
+                    step.detail = detail
+                self._prune()
+                self._mark_dirty()
 
     def skip_step(self, step_id: int, detail: Optional[str] = None):
-        step = self.steps.get(step_id)
-        if step:
-            step.status = "skipped"
-            if detail is not None:
-                step.detail = detail
-            if self._live:
-                self._live.update(self._render())
+        with self._lock:
+            step = self.steps.get(step_id)
+            if step:
+                step.status = "skipped"
+                if detail is not None:
+                    step.detail = detail
+                self._prune()
+                self._mark_dirty()
 
     def stop(self):
         if self._live:
@@ -1,23 +1,55 @@
+import asyncio
+import random
 import time
 import traceback
 import datetime
+import json
 import os
 import re
+import shutil
+import string
 import subprocess
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
-from typing import Set, Optional, List, Tuple
+from typing import Dict, Iterable, Iterator, Mapping, Set, Optional, List, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import cloudscraper
 except ImportError:
     cloudscraper = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from selenium.common.exceptions import (
     WebDriverException,
     TimeoutException,
 )
+from selenium.webdriver.support.ui import WebDriverWait
 
 from rich import print
 from rich.console import Console
@@ -31,32 +63,337 @@ from .step_logger import StepLogger
 HTTP_TIMEOUT = 30
 PLAYLIST_TIMEOUT = 20
 PAGE_TIMEOUT = 25
+HTML_SCAN_CHUNK = 64 * 1024  # Streamed page scan granularity
+HTML_SCAN_OVERLAP = 4096  # Carried between chunks so URLs split across a boundary still match
+PAGE_READY_TIMEOUT = 5  # Max wait for a browser-loaded page to show what we need
+# Bounded so the readiness probe doesn't ship megabytes of HTML over the driver channel
+_HTML_HAS_M3U8_JS = "return document.documentElement.outerHTML.slice(0, 200000).indexOf('.m3u8') !== -1;"
+# In-page fetch helper, installed once per browser so each call ships only a one-line script
+# and the URL travels as an argument instead of being spliced into JS source
+_KICK_FETCH_JS = (
+    "window.__kickFetch = window.__kickFetch || (async url => fetch(url, { credentials: 'include' })"
+    ".then(r => r.ok ? r.json() : { status: r.status, error: 'HTTP ' + r.status })"
+    ".catch(e => ({ error: e && e.message ? e.message : 'fetch error' })));"
+)
+_KICK_FETCH_CALL_JS = "return await window.__kickFetch(arguments[0]);"
+# Precompiled patterns used on per-line / per-segment hot paths
+_ABS_URL_RE = re.compile(r'^https?://')
+_M3U8_SCAN_RE = re.compile(r'https?://[^"\']+\.m3u8')
+_M3U8_URL_RE = re.compile(r'^https?://.+\.m3u8$')
+_BANDWIDTH_RE = re.compile(r'BANDWIDTH=(\d+)')
+_VARIANT_RE = re.compile(r'^(\d+p)')
+_DIGITS_RE = re.compile(r'(\d+)')
+# ffmpeg's HLS demuxer only warns (and still exits 0) when it skips a segment it couldn't open
+_FFMPEG_SEGMENT_SKIP_RE = re.compile(r'Failed to open segment|Server returned \d|HTTP error \d')
+# Deletes every filename-safe char; an empty result means the name needs no sanitizing
+_SAFE_NAME_CHARS = string.ascii_letters + string.digits + '_.-'
+_STRIP_SAFE_CHARS = str.maketrans('', '', _SAFE_NAME_CHARS)
+
+
+class _UnsafeCharTable(dict):
+    """translate() table: safe ASCII maps to itself, anything else (incl. non-ASCII) to a NUL marker."""
+
+    def __missing__(self, codepoint: int) -> str:
+        return '\0'
+
+
+_UNSAFE_TO_MARK = _UnsafeCharTable({ord(c): c for c in _SAFE_NAME_CHARS})
+
 SEGMENT_MAX_FAILURES = 10  # Maximum number of segment failures before aborting
+HTTP_POOL_SIZE = 32  # Keep-alive connections per host; must cover SEGMENT_CONCURRENCY
+VIDEO_JSON_CACHE_SIZE = 64  # v1 video API responses kept per downloader
+UUID_CACHE_SIZE = 256  # Parsed VOD URL -> UUID entries, shared process-wide
+RESOLVE_CONCURRENCY = 8  # Parallel channel lookups in resolve_many
+HTTP2_MAX_CONNECTIONS = 20  # HTTP/2 multiplexes streams, so few connections are actually opened
+STREAM_GAP_RETRY_POLLS = 3  # Extra polls spent re-fetching missing segments once the playlist stops growing
+PROGRESS_MIN_INTERVAL = 0.25  # Seconds between in-place progress line updates
+RATE_LIMIT_RETRIES = 3  # Extra attempts on HTTP 429 before giving the response back
+RATE_LIMIT_BACKOFF = 1.0  # Base delay in seconds, doubled per attempt plus jitter
+RATE_LIMIT_MAX_DELAY = 60.0
+# API and CDN hosts whose keep-alive connections are opened ahead of the first real request
+_PREWARM_URLS = ("https://kick.com/", "https://stream.kick.com/")
+PREWARM_TIMEOUT = 5  # seconds per host
+
+# Picked once per downloader so keep-alive connections keep a consistent identity
+_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15",
+)
+
+# Default header template; each downloader freezes a copy with its chosen User-Agent
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": _USER_AGENTS[0],
+    "Accept": "*/*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Connection": "keep-alive",
+    # Kick/IVS commonly checks Origin/Referer
+    "Origin": "https://kick.com",
+    "Referer": "https://kick.com/",
+})
 
 def _debug(message: str):
     if getattr(Config, "DEBUG_VERBOSE", False):
         print(f"[debug] {message}")
 
+def _sanitize_name(raw: str) -> str:
+    """Replace each run of filename-unsafe chars with a single '_' (existing underscores are kept)."""
+    if not raw.translate(_STRIP_SAFE_CHARS):
+        return raw
+    parts = raw.translate(_UNSAFE_TO_MARK).split('\0')
+    # A run of k marks leaves k-1 empty parts between its neighbours; keep only the edge ones
+    last = len(parts) - 1
+    return '_'.join(p for i, p in enumerate(parts) if p or i == 0 or i == last)
+
+
+@lru_cache(maxsize=UUID_CACHE_SIZE)
+def _parse_uuid(vod_url: str) -> Optional[str]:
+    """Last path component of a VOD URL (the video UUID)."""
+    parts = vod_url.rstrip('/').split('/')
+    return parts[-1] if parts else None
+
+
+def _derive_basename(playlist_url: str, output_basename: Optional[str] = None) -> str:
+    """Filesystem-safe basename: the given one, else the last path parts of the playlist URL."""
+    if not output_basename:
+        parts = urlparse(playlist_url).path.strip('/').split('/')
+        ident = '-'.join(parts[-3:]) if len(parts) >= 3 else parts[-1]
+        output_basename = ident.replace('.m3u8', '')
+    return _sanitize_name(output_basename)
+
+
+def _parse_m3u8(text: str, playlist_url: str) -> Optional[Tuple[List[Tuple[int, str, str]], bool]]:
+    """
+    Single-pass media playlist parse. Returns ([(media_sequence, segment_url, local_filename)], ended),
+    or None when the text is not an m3u8 playlist.
+    """
+    base_url = playlist_url.rsplit('/', 1)[0]
+    segs: List[Tuple[int, str, str]] = []
+    ended = False
+    sequence = 0
+    header_seen = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        if not header_seen:
+            if not line.startswith('#EXTM3U'):
+                return None
+            header_seen = True
+            continue
+        if line.startswith('#'):
+            if line.startswith('#EXT-X-MEDIA-SEQUENCE:'):
+                try:
+                    sequence = int(line.split(':', 1)[1])
+                except ValueError:
+                    pass
+            ended |= line.startswith('#EXT-X-ENDLIST')
+            continue
+        # Expect lines like "0.ts", "1.ts", or absolute URLs
+        if line.endswith('.ts'):
+            full_url = line if line.startswith(('http://', 'https://')) else f"{base_url}/{line}"
+            # Local filename from URL path
+            local_name = os.path.basename(urlparse(full_url).path)
+            if not local_name.endswith('.ts'):
+                local_name = f"{local_name}.ts"
+            segs.append((sequence, full_url, local_name))
+            sequence += 1
+    if not header_seen:
+        return None
+    return segs, ended
+
+
+def _rate_limit_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Seconds to wait after a 429: the server's Retry-After if given, else jittered exponential backoff."""
+    delay = None
+    if retry_after:
+        if retry_after.strip().isdigit():
+            delay = float(retry_after.strip())
+        else:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+    if delay is None or delay < 0:
+        delay = RATE_LIMIT_BACKOFF * (2 ** attempt)
+    return min(delay, RATE_LIMIT_MAX_DELAY) + random.uniform(0, RATE_LIMIT_BACKOFF)
+
+
+class _ProgressLine:
+    """In-place progress line throttled by wall time; plain stdout writes skip Rich markup parsing."""
+
+    def __init__(self, interval: float = PROGRESS_MIN_INTERVAL):
+        self._interval = interval
+        self._last = 0.0
+
+    def update(self, text: str, final: bool = False) -> None:
+        now = time.monotonic()
+        if not final and now - self._last < self._interval:
+            return
+        self._last = now
+        sys.stdout.write(f"{text}\r")
+        sys.stdout.flush()
+
+
+def _load_stream_state(path: str) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_stream_state(path: str, state: dict) -> None:
+    """Atomically replace the per-VOD state sidecar (media-sequence cursor and segment counts)."""
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _debug(f"could not write stream state {path}: {e}")
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _finalize_part_file(part_path: str, final_path: str, written: int, response_headers) -> None:
+    """
+    Atomically publish a fully downloaded .part file. Raises if the body is shorter than
+    Content-Length, so a truncated segment never appears under its final name.
+    """
+    expected = response_headers.get('Content-Length')
+    # Content-Length counts encoded bytes; only comparable for identity-encoded bodies
+    if expected and expected.isdigit() and not response_headers.get('Content-Encoding') and written != int(expected):
+        raise IOError(f"incomplete segment body: {written}/{expected} bytes")
+    os.replace(part_path, final_path)
+
+
+def _copy_file_to_stream(src_f, dst_f) -> None:
+    """Copy an open file into dst_f, splicing kernel-side with os.sendfile where the platform allows."""
+    offset = 0
+    if hasattr(os, 'sendfile'):
+        dst_f.flush()
+        try:
+            size = os.fstat(src_f.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(dst_f.fileno(), src_f.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except BrokenPipeError:
+            raise
+        except OSError:
+            # e.g. EINVAL/ENOSYS for unsupported fd types: finish in user space from where we stopped
+            pass
+    src_f.seek(offset)
+    shutil.copyfileobj(src_f, dst_f, length=1024 * 1024)
+
+
 class VodDownloader:
     def __init__(self, driver: Optional[RemoteWebDriver], console: Console, file_manager: FileManager, step_logger: Optional[StepLogger] = None):
+        # Per-thread flag: resolve_many workers must not touch the (non thread-safe) driver
+        self._thread_state = threading.local()
         self.driver = driver
         self.console = console
         self.file_manager = file_manager
         self.step_logger: Optional[StepLogger] = step_logger
+        # Metadata and master lookups for the same UUID share one API call
+        self._video_json_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._default_headers = MappingProxyType({**_DEFAULT_HEADERS, "User-Agent": random.choice(_USER_AGENTS)})
+        self._http_client_lock = threading.Lock()
         self._http_client, self._http_uses_cloudscraper = self._create_http_client()
 
-    def _build_headers(self, referer: Optional[str] = None) -> dict:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Accept": "*/*",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Connection": "keep-alive",
-        }
-        # Kick/IVS commonly checks Origin/Referer
-        headers["Origin"] = "https://kick.com"
-        headers["Referer"] = referer or "https://kick.com/"
+    @property
+    def driver(self) -> Optional[RemoteWebDriver]:
+        if getattr(self._thread_state, "driverless", False):
+            return None
+        return self._driver
+
+    @driver.setter
+    def driver(self, value: Optional[RemoteWebDriver]) -> None:
+        self._driver = value
+        self._js_helpers_installed = False
+
+    def _install_js_helpers(self) -> None:
+        """
+        Register window.__kickFetch for every future document (navigation resets window) and the
+        current one. Drivers without CDP get the helper defined inline on each call instead.
+        """
+        self._js_helpers_installed = True
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _KICK_FETCH_JS})
+            self.driver.execute_cdp_cmd("Runtime.evaluate", {"expression": _KICK_FETCH_JS})
+            self._kick_fetch_script = _KICK_FETCH_CALL_JS
+        except Exception as e:
+            _debug(f"CDP helper install failed, defining fetch helper per call: {e}")
+            self._kick_fetch_script = _KICK_FETCH_JS + " " + _KICK_FETCH_CALL_JS
+
+    def _browser_fetch_json(self, url: str):
+        """
+        Fetch url from the page context with its cookies. Returns the parsed JSON, or a
+        {'error': ..., 'status': ...} dict for HTTP errors, non-JSON bodies and network failures.
+        """
+        if not self._js_helpers_installed:
+            self._install_js_helpers()
+        return self.driver.execute_script(self._kick_fetch_script, url)
+
+    def _build_headers(self, referer: Optional[str] = None) -> Mapping[str, str]:
+        if not referer:
+            return self._default_headers
+        headers = dict(self._default_headers)
+        headers["Referer"] = referer
         return headers
 
+    @staticmethod
+    def _json(resp):
+        """Decode a response body; faster than resp.json() when orjson is installed."""
+        return _loads(resp.content)
+
+    def prewarm_connections(self) -> None:
+        """
+        HEAD the API/CDN hosts in the background so the pooled client already holds open
+        connections when the first real request goes out. Start it before slow work like Chrome startup.
+        """
+        def run():
+            for url in _PREWARM_URLS:
+                try:
+                    # Any status will do: only the kept-alive connection matters
+                    self._http_client.head(url, headers=self._default_headers, timeout=PREWARM_TIMEOUT).close()
+                except Exception as e:
+                    _debug(f"prewarm {url} failed: {e}")
+
+        threading.Thread(target=run, name="prewarm-connections", daemon=True).start()
+
+    def _mount_pooled_adapter(self, client) -> None:
+        # Default adapters hold only 10 connections per host, which throttles
+        # parallel segment downloads and forces fresh TCP+TLS handshakes
+        pool_size = max(HTTP_POOL_SIZE, Config.SEGMENT_CONCURRENCY)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                # 429 is left to _http_get, which caps Retry-After and adds jitter; urllib3 would
+                # otherwise retry any Retry-After response itself, uncapped
+                status_forcelist=[500, 502, 503, 504],
+                respect_retry_after_header=False,
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            ),
+        )
+        client.mount("https://", adapter)
+        client.mount("http://", adapter)
+
     def _create_http_client(self, force_cloudscraper: bool = False):
         if cloudscraper:
             try:
@@ -67,6 +404,7 @@ class VodDownloader:
                         "mobile": False,
                     }
                 )
+                self._mount_pooled_adapter(scraper)
                 if Config.DEBUG_HTTP:
                     print("[debug] Initialized cloudscraper HTTP client")
                 return scraper, True
@@ -74,31 +412,274 @@ class VodDownloader:
                 if force_cloudscraper or Config.DEBUG_HTTP:
                     print(f"[yellow]cloudscraper init failed: {e}. Falling back to requests.[/yellow]")
         session = requests.Session()
+        self._mount_pooled_adapter(session)
         if Config.DEBUG_HTTP:
             print("[debug] Using requests.Session for HTTP client")
         return session, False
 
-    def _http_get(self, url: str, headers: Optional[dict] = None, allow_retry: bool = True, **kwargs):
-        final_headers = dict(headers) if headers else self._build_headers()
+    def _http_get(self, url: str, headers: Optional[Mapping[str, str]] = None, allow_retry: bool = True, **kwargs):
+        # requests merges headers into its own dict, so the caller's mapping is passed as-is
+        final_headers = headers or self._build_headers()
         if "timeout" not in kwargs:
             kwargs["timeout"] = HTTP_TIMEOUT
         client = self._http_client
         try:
             response = client.get(url, headers=final_headers, **kwargs)
+            # Back off on rate limiting instead of degrading to the slower cloudscraper client
+            for attempt in range(RATE_LIMIT_RETRIES):
+                if response.status_code != 429:
+                    break
+                delay = _rate_limit_delay(response.headers.get("Retry-After"), attempt)
+                if Config.DEBUG_HTTP:
+                    print(f"[debug] HTTP 429 for {url}. Retrying in {delay:.1f}s.")
+                response.close()
+                time.sleep(delay)
+                response = client.get(url, headers=final_headers, **kwargs)
         except Exception as e:
             if allow_retry and cloudscraper and not self._http_uses_cloudscraper:
                 if Config.DEBUG_HTTP:
                     print(f"[debug] Exception during GET {url}: {e}. Retrying with cloudscraper.")
-                self._http_client, self._http_uses_cloudscraper = self._create_http_client(force_cloudscraper=True)
-                return self._http_get(url, headers=final_headers, allow_retry=False, **kwargs)
+                if self._switch_to_cloudscraper(client):
+                    return self._http_get(url, headers=final_headers, allow_retry=False, **kwargs)
             raise
         if response.status_code == 403 and allow_retry and cloudscraper and not self._http_uses_cloudscraper:
             if Config.DEBUG_HTTP:
                 print(f"[debug] HTTP 403 for {url}. Retrying with cloudscraper.")
-            self._http_client, self._http_uses_cloudscraper = self._create_http_client(force_cloudscraper=True)
-            return self._http_get(url, headers=final_headers, allow_retry=False, **kwargs)
+            if self._switch_to_cloudscraper(client):
+                response.close()
+                return self._http_get(url, headers=final_headers, allow_retry=False, **kwargs)
         return response
 
+    def _switch_to_cloudscraper(self, failed_client) -> bool:
+        """
+        Replace the shared client with a cloudscraper one, once. Keeps the existing pooled
+        session (and its warm connections) if cloudscraper can't be created.
+        """
+        with self._http_client_lock:
+            if self._http_client is not failed_client:
+                # Another thread already switched; just retry on the new client
+                return True
+            client, uses_cloudscraper = self._create_http_client(force_cloudscraper=True)
+            if not uses_cloudscraper:
+                client.close()
+                return False
+            self._http_client, self._http_uses_cloudscraper = client, True
+        failed_client.close()
+        return True
+
+    def _http_get_stream(self, url: str, headers: Mapping[str, str]):
+        # Segment hot path: CDN hosts don't sit behind Cloudflare, so skip the cloudscraper fallback,
+        # but back off on CDN rate limiting instead of counting a 429 as a failed segment
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = self._http_client.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                return response
+            delay = _rate_limit_delay(response.headers.get("Retry-After"), attempt)
+            _debug(f"segment HTTP 429 -> {url}, retrying in {delay:.1f}s")
+            response.close()
+            time.sleep(delay)
+
+    @staticmethod
+    async def _astream_segment(client, url: str, headers: Mapping[str, str]):
+        """Async twin of _http_get_stream for the httpx client; the caller must aclose() the response."""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = await client.send(client.build_request('GET', url, headers=headers), stream=True)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                return response
+            delay = _rate_limit_delay(response.headers.get("Retry-After"), attempt)
+            _debug(f"segment HTTP 429 -> {url}, retrying in {delay:.1f}s")
+            await response.aclose()
+            await asyncio.sleep(delay)
+
+    def _download_segment_to_file(self, seg_url: str, local_path: str, headers: Mapping[str, str]) -> bool:
+        """Download one segment to local_path. Returns False on a non-200 response; raises on errors."""
+        if Config.DEBUG_HTTP:
+            print(f"[debug] GET {seg_url}")
+        # The with block hands the connection back to the pool even on the skip/error paths
+        with self._http_get_stream(seg_url, headers) as seg_resp:
+            if seg_resp.status_code != 200:
+                print(f"[yellow]Segment HTTP {seg_resp.status_code} skipped:[/yellow] {seg_url}")
+                _debug(f"segment HTTP {seg_resp.status_code} -> {seg_url}")
+                return False
+            # Copy straight from the urllib3 response in 1 MB reads instead of iter_content chunks
+            seg_resp.raw.decode_content = True
+            part_path = f"{local_path}.part"
+            try:
+                with open(part_path, 'wb') as f:
+                    shutil.copyfileobj(seg_resp.raw, f, length=1024 * 1024)
+                    written = f.tell()
+                _finalize_part_file(part_path, local_path, written, seg_resp.headers)
+            except BaseException:
+                _remove_quietly(part_path)
+                raise
+        return True
+
+    async def _download_segments_async(self, client, tasks: List[Tuple[int, str, str]], headers: Mapping[str, str], on_result) -> None:
+        """Fetch (idx, url, path) tasks over one multiplexed HTTP/2 client, reporting each outcome to on_result."""
+        sem = asyncio.Semaphore(Config.SEGMENT_CONCURRENCY)
+        aborted = False
+
+        async def fetch(idx: int, seg_url: str, seg_path: str):
+            nonlocal aborted
+            async with sem:
+                if aborted:
+                    return
+                ok, error = False, None
+                try:
+                    r = await self._astream_segment(client, seg_url, headers)
+                    try:
+                        if r.status_code != 200:
+                            print(f"[yellow]Segment HTTP {r.status_code} skipped:[/yellow] {seg_url}")
+                            _debug(f"segment HTTP {r.status_code} -> {seg_url}")
+                        else:
+                            # Disk I/O runs in worker threads so a slow write doesn't stall other streams
+                            part_path = f"{seg_path}.part"
+                            try:
+                                f = await asyncio.to_thread(open, part_path, 'wb')
+                                try:
+                                    async for chunk in r.aiter_bytes(1024 * 1024):
+                                        await asyncio.to_thread(f.write, chunk)
+                                    written = f.tell()
+                                finally:
+                                    await asyncio.to_thread(f.close)
+                                await asyncio.to_thread(_finalize_part_file, part_path, seg_path, written, r.headers)
+                            except BaseException:
+                                _remove_quietly(part_path)
+                                raise
+                            ok = True
+                    finally:
+                        await r.aclose()
+                except Exception as e:
+                    error = e
+                if not aborted and not on_result(idx, ok, error):
+                    aborted = True
+
+        await asyncio.gather(*(fetch(*task) for task in tasks))
+
+    def _download_segments_http2(self, tasks: List[Tuple[int, str, str]], headers: Mapping[str, str], on_result) -> bool:
+        """Run the async HTTP/2 downloader to completion. Returns False if HTTP/2 is unavailable."""
+        try:
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=HTTP2_MAX_CONNECTIONS, max_keepalive_connections=HTTP2_MAX_CONNECTIONS),
+                timeout=HTTP_TIMEOUT,
+            )
+        except ImportError as e:
+            # http2=True needs the optional h2 package
+            _debug(f"HTTP/2 segment client unavailable: {e}")
+            return False
+
+        async def run():
+            async with client:
+                await self._download_segments_async(client, tasks, headers, on_result)
+
+        asyncio.run(run())
+        return True
+
+    def _run_ffmpeg_to_mp3(self, input_args: List[str], mp3_output_path: str, segment_paths: Optional[List[str]] = None,
+                           show_progress: bool = False, report_errors: bool = True, loglevel: str = 'error',
+                           fail_on_stderr=None) -> bool:
+        """
+        Run ffmpeg on input_args and encode to MP3. When segment_paths is given, input_args
+        must read pipe:0 and the MPEG-TS segments are fed to stdin in order; TS is
+        byte-concatenable, so no intermediate concatenated file is written.
+        A fail_on_stderr pattern matching ffmpeg's output fails the run even on exit code 0.
+        """
+        ffmpeg_cmd = [
+            'ffmpeg',
+            '-hide_banner', '-loglevel', loglevel,
+            '-y',
+            *input_args,
+            '-vn',
+            '-acodec', 'libmp3lame',
+            '-ab', '128k',
+            '-ar', '48000',
+            mp3_output_path
+        ]
+        try:
+            if segment_paths is None:
+                result = subprocess.run(ffmpeg_cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False)
+                returncode, stderr_bytes = result.returncode, result.stderr
+            else:
+                returncode, stderr_bytes = self._feed_segments_to_ffmpeg(ffmpeg_cmd, segment_paths, show_progress)
+        except FileNotFoundError:
+            print("[bold red]ffmpeg not found. Please install ffmpeg and ensure it is in PATH.[/bold red]")
+            _debug("ffmpeg missing")
+            return False
+        if returncode != 0:
+            stderr = stderr_bytes.decode('utf-8', 'replace')
+            if report_errors:
+                print(f"[bold red]ffmpeg failed ({returncode}).[/bold red]")
+                if stderr:
+                    print(stderr)
+            _debug(f"ffmpeg failed ({returncode}) stderr={stderr}")
+            return False
+        if fail_on_stderr is not None:
+            stderr = stderr_bytes.decode('utf-8', 'replace')
+            if fail_on_stderr.search(stderr):
+                _debug(f"ffmpeg output rejected: {stderr}")
+                _remove_quietly(mp3_output_path)
+                return False
+        return True
+
+    def _feed_segments_to_ffmpeg(self, ffmpeg_cmd: List[str], segment_paths: List[str], show_progress: bool) -> Tuple[int, bytes]:
+        """Run ffmpeg with segment files streamed into its stdin; returns (returncode, stderr)."""
+        # stderr goes to a temp file so a chatty ffmpeg can't stall on a full pipe while we write stdin
+        progress = _ProgressLine() if show_progress else None
+        with tempfile.TemporaryFile() as err_f:
+            process = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=err_f)
+            try:
+                for i, seg_path in enumerate(segment_paths):
+                    try:
+                        seg_f = open(seg_path, 'rb')
+                    except OSError as e:
+                        print(f"[yellow]Skipping unreadable segment {os.path.basename(seg_path)}: {e}[/yellow]")
+                        continue
+                    with seg_f:
+                        _copy_file_to_stream(seg_f, process.stdin)
+                    if progress and ((i + 1) % 50 == 0 or (i + 1) == len(segment_paths)):
+                        progress.update(f"Encoded {i + 1}/{len(segment_paths)} segments", final=(i + 1) == len(segment_paths))
+            except BrokenPipeError:
+                # ffmpeg exited early; its return code and stderr explain why
+                pass
+            except BaseException:
+                # Don't leave an orphaned ffmpeg behind (e.g. on Ctrl+C mid-feed)
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+            returncode = process.wait()
+            err_f.seek(0)
+            return returncode, err_f.read()
+
+    def _pipe_segments_to_mp3(self, segment_paths: List[str], mp3_output_path: str, show_progress: bool = False) -> bool:
+        """Feed MPEG-TS segments to ffmpeg's stdin in playlist order and encode to MP3."""
+        return self._run_ffmpeg_to_mp3(['-f', 'mpegts', '-i', 'pipe:0'], mp3_output_path,
+                                       segment_paths=segment_paths, show_progress=show_progress)
+
+    def _ffmpeg_hls_to_mp3(self, playlist_url: str, mp3_output_path: str, headers: Mapping[str, str]) -> bool:
+        """
+        Let ffmpeg's HLS demuxer fetch the playlist and segments itself over persistent
+        connections and encode straight to MP3. Returns False so callers can fall back.
+        """
+        input_args = [
+            '-protocol_whitelist', 'file,http,https,tcp,tls,crypto',
+            '-user_agent', headers.get("User-Agent", ""),
+            '-referer', headers.get("Referer", "https://kick.com/"),
+            '-headers', f"Origin: {headers.get('Origin', 'https://kick.com')}\r\n",
+            '-http_persistent', '1',
+            '-multiple_requests', '1',
+            '-i', playlist_url,
+        ]
+        # Failures are only logged: the caller falls back to downloading segments itself.
+        # Warnings are kept so skipped segments count as a failure instead of a silent gap
+        return self._run_ffmpeg_to_mp3(input_args, mp3_output_path, report_errors=False,
+                                       loglevel='warning', fail_on_stderr=_FFMPEG_SEGMENT_SKIP_RE)
+
     def fetch_channel_vod_links(self, channel_name: str) -> List[str]:
         # print(f"\n[cyan]Fetching VOD links for channel:[/cyan] [bold magenta]{channel_name}[/bold magenta]")
         api_url = f"https://kick.com/api/v2/channels/{channel_name}/videos?cursor=0&sort=date&time=all"
@@ -106,8 +687,7 @@ class VodDownloader:
 
         try:
             # print(f"[cyan]Executing fetch for API URL:[/cyan] {api_url}")
-            script = f"return await fetch('{api_url}').then(response => response.json()).catch(e => {{ console.error('Fetch API Error:', e); return {{ error: e.message }}; }});"
-            response_data = self.driver.execute_script(script)
+            response_data = self._browser_fetch_json(api_url)
 
             if not response_data:
                 print("[yellow]Warning:[/yellow] No VOD found in API response.")
@@ -155,8 +735,8 @@ class VodDownloader:
     def download_vod_from_m3u8(self, playlist_url: str, output_basename: Optional[str] = None) -> Optional[str]:
         """
         Prototype: Download Kick VOD by fetching the HLS playlist (.m3u8),
-        downloading all .ts segments, concatenating to a single .ts, and
-        converting to MP3 using ffmpeg.
+        downloading all .ts segments, and piping them in order into ffmpeg
+        to convert to MP3.
 
         Returns the path to the resulting MP3 on success, otherwise None.
         """
@@ -166,56 +746,52 @@ class VodDownloader:
             if Config.DEBUG_HTTP:
                 print(f"[debug] GET {playlist_url}\n[debug] headers: {headers}")
             _debug(f"download_vod_from_m3u8: fetching playlist {playlist_url}")
-            resp = self._http_get(playlist_url, headers=headers, timeout=HTTP_TIMEOUT)
-            if Config.DEBUG_HTTP:
-                print(f"[debug] -> HTTP {resp.status_code}")
-            if resp.status_code != 200:
-                print(f"[bold red]Failed to fetch playlist. HTTP {resp.status_code}[/bold red]")
-                _debug(f"download_vod_from_m3u8: playlist HTTP {resp.status_code}")
-                return None
+            with self._http_get(playlist_url, headers=headers, timeout=HTTP_TIMEOUT) as resp:
+                if Config.DEBUG_HTTP:
+                    print(f"[debug] -> HTTP {resp.status_code}")
+                if resp.status_code != 200:
+                    print(f"[bold red]Failed to fetch playlist. HTTP {resp.status_code}[/bold red]")
+                    _debug(f"download_vod_from_m3u8: playlist HTTP {resp.status_code}")
+                    return None
+                playlist_text = resp.text
 
-            text = resp.text
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            if not lines or not lines[0].startswith('#EXTM3U'):
+            parsed_playlist = _parse_m3u8(playlist_text, playlist_url)
+            if parsed_playlist is None:
                 print("[bold red]Invalid or empty m3u8 playlist.[/bold red]")
                 _debug("download_vod_from_m3u8: invalid playlist content")
                 return None
-
-            base_url = playlist_url.rsplit('/', 1)[0]
-
-            segment_urls: List[str] = []
-            for line in lines:
-                if line.startswith('#'):
-                    continue
-                # Expect lines like "0.ts", "1.ts", or absolute URLs
-                if line.endswith('.ts'):
-                    if re.match(r'^https?://', line):
-                        segment_urls.append(line)
-                    else:
-                        segment_urls.append(f"{base_url}/{line}")
+            segment_urls = [seg_url for _, seg_url, _ in parsed_playlist[0]]
 
             if not segment_urls:
                 print("[bold red]No TS segments found in playlist.[/bold red]")
                 return None
 
-            # Determine output base name
-            if not output_basename:
-                # Use last two path parts as a simple identifier
-                parsed = urlparse(playlist_url)
-                parts = parsed.path.strip('/').split('/')
-                ident = '-'.join(parts[-3:]) if len(parts) >= 3 else parts[-1]
-                output_basename = ident.replace('.m3u8', '')
+            safe_basename = _derive_basename(playlist_url, output_basename)
+            mp3_output_path = os.path.join(Config.DOWNLOAD_DIR, f"{safe_basename}.mp3")
+            _debug(f"download_vod_from_m3u8: output path {mp3_output_path}")
+
+            # Fast path: ffmpeg ingests the playlist itself, no segments pass through Python
+            if Config.USE_FFMPEG_HLS:
+                ffmpeg_step_id = None
+                if self.step_logger:
+                    ffmpeg_step_id = self.step_logger.start_step(f"Download {len(segment_urls)} segments via ffmpeg")
+                else:
+                    print(f"[cyan]Downloading {len(segment_urls)} segments via ffmpeg...[/cyan]")
+                if self._ffmpeg_hls_to_mp3(playlist_url, mp3_output_path, headers):
+                    if self.step_logger and ffmpeg_step_id:
+                        self.step_logger.complete_step(ffmpeg_step_id)
+                    print(f"[bold green]MP3 saved:[/bold green] {mp3_output_path}")
+                    _debug(f"download_vod_from_m3u8: MP3 saved via ffmpeg HLS {mp3_output_path}")
+                    return mp3_output_path
+                if self.step_logger and ffmpeg_step_id:
+                    self.step_logger.skip_step(ffmpeg_step_id, detail="falling back to segment download")
+                else:
+                    print("[yellow]ffmpeg HLS input failed. Falling back to segment download...[/yellow]")
 
-            safe_basename = re.sub(r'[^A-Za-z0-9_.\-]+', '_', output_basename)
             work_dir = os.path.join(Config.DOWNLOAD_DIR, safe_basename)
             os.makedirs(work_dir, exist_ok=True)
             _debug(f"download_vod_from_m3u8: work_dir {work_dir}")
 
-            concat_ts_path = os.path.join(work_dir, f"{safe_basename}.ts")
-            mp3_output_path = os.path.join(Config.DOWNLOAD_DIR, f"{safe_basename}.mp3")
-            _debug(f"download_vod_from_m3u8: concat path {concat_ts_path}")
-            _debug(f"download_vod_from_m3u8: output path {mp3_output_path}")
-
             seg_step_id = None
             if self.step_logger:
                 seg_step_id = self.step_logger.start_step(f"Download {len(segment_urls)} segments")
@@ -223,73 +799,74 @@ class VodDownloader:
             else:
                 print(f"[cyan]Downloading {len(segment_urls)} segments...[/cyan]")
 
+            # Download segments in parallel into per-index files, then concatenate in order
+            total = len(segment_urls)
+            tasks = [(idx, seg_url, os.path.join(work_dir, f"seg_{idx:06d}.ts")) for idx, seg_url in enumerate(segment_urls)]
+            downloaded: Set[int] = set()
             failed_segments = 0
-            with open(concat_ts_path, 'wb') as out_f:
-                for idx, seg_url in enumerate(segment_urls):
-                    try:
-                        if Config.DEBUG_HTTP:
-                            print(f"[debug] GET {seg_url}")
-                        _debug(f"download_vod_from_m3u8: segment {idx + 1}/{len(segment_urls)} -> {seg_url}")
-                        seg_resp = self._http_get(seg_url, headers=headers, timeout=HTTP_TIMEOUT, stream=True)
-                        if seg_resp.status_code != 200:
-                            failed_segments += 1
-                            print(f"[yellow]Segment HTTP {seg_resp.status_code} skipped:[/yellow] {seg_url}")
-                            _debug(f"download_vod_from_m3u8: segment HTTP {seg_resp.status_code}")
-                            if failed_segments >= SEGMENT_MAX_FAILURES:
-                                print(f"[bold red]Too many segment failures ({failed_segments}). Aborting.[/bold red]")
-                                return None
-                            continue
-                        for chunk in seg_resp.iter_content(chunk_size=1024 * 256):
-                            if chunk:
-                                out_f.write(chunk)
-                        if (idx + 1) % 10 == 0 or (idx + 1) == len(segment_urls):
-                            if self.step_logger and seg_step_id:
-                                self.step_logger.set_detail(seg_step_id, f"{idx + 1}/{len(segment_urls)}")
-                            else:
-                                print(f"[green]Downloaded {idx + 1}/{len(segment_urls)}[/green]", end='\r')
-                    except Exception as e:
-                        failed_segments += 1
-                        print(f"[yellow]Warning: Error downloading segment {idx}:[/yellow] {e}")
-                        _debug(f"download_vod_from_m3u8: segment error {e}")
-                        if failed_segments >= SEGMENT_MAX_FAILURES:
-                            print(f"[bold red]Too many segment failures ({failed_segments}). Aborting.[/bold red]")
-                            if self.step_logger and seg_step_id:
-                                self.step_logger.error_step(seg_step_id, detail=f"failed at {idx + 1}/{len(segment_urls)}")
-                            return None
+            done_count = 0
+            progress = _ProgressLine()
+
+            def on_result(idx: int, ok: bool, error: Optional[Exception]) -> bool:
+                """Record one segment outcome; returns False once too many segments have failed."""
+                nonlocal failed_segments, done_count
+                done_count += 1
+                if ok:
+                    downloaded.add(idx)
+                else:
+                    failed_segments += 1
+                    if error is not None:
+                        print(f"[yellow]Warning: Error downloading segment {idx}:[/yellow] {error}")
+                        _debug(f"download_vod_from_m3u8: segment error {error}")
+                if done_count % 10 == 0 or done_count == total:
+                    if self.step_logger and seg_step_id:
+                        self.step_logger.set_detail(seg_step_id, f"{done_count}/{total}")
+                    else:
+                        progress.update(f"Downloaded {done_count}/{total}", final=done_count == total)
+                return failed_segments < SEGMENT_MAX_FAILURES
+
+            used_http2 = bool(Config.USE_HTTP2_SEGMENTS and httpx is not None
+                              and self._download_segments_http2(tasks, headers, on_result))
+            if not used_http2:
+                with ThreadPoolExecutor(max_workers=Config.SEGMENT_CONCURRENCY) as pool:
+                    futures = {
+                        pool.submit(self._download_segment_to_file, seg_url, seg_path, headers): idx
+                        for idx, seg_url, seg_path in tasks
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            ok, error = future.result(), None
+                        except Exception as e:
+                            ok, error = False, e
+                        if not on_result(futures[future], ok, error):
+                            for pending in futures:
+                                pending.cancel()
+                            break
+            if failed_segments >= SEGMENT_MAX_FAILURES:
+                print(f"[bold red]Too many segment failures ({failed_segments}). Aborting.[/bold red]")
+                if self.step_logger and seg_step_id:
+                    self.step_logger.error_step(seg_step_id, detail=f"failed at {done_count}/{total}")
+                return None
+
             if self.step_logger and seg_step_id:
                 self.step_logger.complete_step(seg_step_id, detail=f"{len(segment_urls)}/{len(segment_urls)}")
             else:
-                print(f"\n[bold green]All segments downloaded and concatenated.[/bold green]")
+                print(f"\n[bold green]All segments downloaded.[/bold green]")
             _debug(f"download_vod_from_m3u8: all segments downloaded ({len(segment_urls)})")
 
-            # Convert concatenated TS to MP3 using ffmpeg directly
+            # Stream the segments into ffmpeg in playlist order
             if not self.step_logger:
-                print("[cyan]Converting concatenated TS to MP3 via ffmpeg...[/cyan]")
+                print("[cyan]Converting segments to MP3 via ffmpeg...[/cyan]")
             _debug("download_vod_from_m3u8: launching ffmpeg conversion")
-            ffmpeg_cmd = [
-                'ffmpeg',
-                '-hide_banner', '-loglevel', 'error',
-                '-y',
-                '-i', concat_ts_path,
-                '-vn',
-                '-acodec', 'libmp3lame',
-                '-ab', '128k',
-                '-ar', '48000',
-                mp3_output_path
-            ]
-            try:
-                process = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-                stdout, stderr = process.communicate()
-                if process.returncode != 0:
-                    print(f"[bold red]ffmpeg failed ({process.returncode}).[/bold red]")
-                    if stderr:
-                        print(stderr)
-                    _debug(f"download_vod_from_m3u8: ffmpeg failed ({process.returncode}) stderr={stderr}")
-                    return None
-            except FileNotFoundError:
-                print("[bold red]ffmpeg not found. Please install ffmpeg and ensure it is in PATH.[/bold red]")
-                _debug("download_vod_from_m3u8: ffmpeg missing")
+            segment_paths = [seg_path for idx, _, seg_path in tasks if idx in downloaded]
+            if not self._pipe_segments_to_mp3(segment_paths, mp3_output_path):
                 return None
+            for seg_path in segment_paths:
+                _remove_quietly(seg_path)
+            try:
+                os.rmdir(work_dir)
+            except OSError:
+                pass
 
             print(f"[bold green]MP3 saved:[/bold green] {mp3_output_path}")
             _debug(f"download_vod_from_m3u8: MP3 saved {mp3_output_path}")
@@ -305,7 +882,7 @@ class VodDownloader:
         Stream-aware downloader:
         - Downloads all current segments and saves each .ts file individually
         - Polls the playlist every poll_seconds to fetch new segments (for live VODs)
-        - When #EXT-X-ENDLIST is seen or on interrupt, concatenates and converts to MP3
+        - When #EXT-X-ENDLIST is seen or on interrupt, pipes the segments into ffmpeg to convert to MP3
 
         Returns the path to the resulting MP3 on success, otherwise None.
         """
@@ -313,57 +890,32 @@ class VodDownloader:
         _debug(f"stream_vod_from_m3u8: start playlist {playlist_url}")
 
         # Resolve basename/workdir
-        if not output_basename:
-            parsed = urlparse(playlist_url)
-            parts = parsed.path.strip('/').split('/')
-            ident = '-'.join(parts[-3:]) if len(parts) >= 3 else parts[-1]
-            output_basename = ident.replace('.m3u8', '')
-        safe_basename = re.sub(r'[^A-Za-z0-9_.\-]+', '_', output_basename)
+        safe_basename = _derive_basename(playlist_url, output_basename)
         work_dir = os.path.join(Config.DOWNLOAD_DIR, safe_basename)
         segments_dir = os.path.join(work_dir, 'segments')
         os.makedirs(segments_dir, exist_ok=True)
 
-        # Track already downloaded segments (support resuming)
-        downloaded_files: Set[str] = set(f for f in os.listdir(segments_dir) if f.endswith('.ts'))
+        # Track already downloaded segments (support resuming) with one directory scan.
+        # Leftover "<n>.ts.part" files from an interrupted run don't match and get re-downloaded
+        with os.scandir(segments_dir) as it:
+            downloaded_files: Set[str] = {e.name for e in it if e.name.endswith('.ts')}
+        # Sidecar with the previous run's segment counts and media-sequence cursor; if segments were
+        # removed since it was written, the cursor would skip them, so start over
+        state_path = os.path.join(work_dir, 'state.json')
+        state = _load_stream_state(state_path)
+        stored_count = state.get("segment_count")
+        if not isinstance(stored_count, int) or len(downloaded_files) < stored_count:
+            state = {}
         seg_step_id = None
         if self.step_logger:
             seg_step_id = self.step_logger.start_step("Download segments (streaming)")
             self.step_logger.set_detail(seg_step_id, f"total: {len(downloaded_files)}")
         _debug(f"stream_vod_from_m3u8: existing segments {len(downloaded_files)}")
 
-        def parse_playlist(text: str) -> Tuple[List[Tuple[str, str]], bool]:
-            """Return list of (segment_url, local_filename) and whether ENDLIST present."""
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            if not lines or not lines[0].startswith('#EXTM3U'):
-                return [], False
-            base_url = playlist_url.rsplit('/', 1)[0]
-            ended = any('#EXT-X-ENDLIST' in line for line in lines)
-
-            segs: List[Tuple[str, str]] = []
-            for line in lines:
-                if line.startswith('#'):
-                    continue
-                if line.endswith('.ts'):
-                    full_url = line if re.match(r'^https?://', line) else f"{base_url}/{line}"
-                    # Local filename from URL path
-                    local_name = os.path.basename(urlparse(full_url).path)
-                    if not local_name.endswith('.ts'):
-                        local_name = f"{local_name}.ts"
-                    segs.append((full_url, local_name))
-            return segs, ended
-
         def download_segment(seg_url: str, local_path: str) -> bool:
             try:
-                if Config.DEBUG_HTTP:
-                    print(f"[debug] GET {seg_url}")
-                r = self._http_get(seg_url, headers=headers, timeout=HTTP_TIMEOUT, stream=True)
-                if r.status_code != 200:
-                    print(f"[yellow]Segment HTTP {r.status_code} skipped:[/yellow] {seg_url}")
+                if not self._download_segment_to_file(seg_url, local_path, headers):
                     return False
-                with open(local_path, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=1024 * 256):
-                        if chunk:
-                            f.write(chunk)
                 _debug(f"stream_vod_from_m3u8: downloaded {local_path}")
                 return True
             except Exception as e:
@@ -372,75 +924,54 @@ class VodDownloader:
                 return False
 
         def convert_all_segments_to_mp3() -> Optional[str]:
-            files = [f for f in os.listdir(segments_dir) if f.endswith('.ts')]
-            if not files:
+            if not downloaded_files:
                 print("[yellow]No segments to convert.[/yellow]")
                 return None
-            # Sort by numeric index when available
-            def sort_key(name: str):
-                m = re.search(r'(\d+)', name)
-                return (int(m.group(1)) if m else 10**12, name)
-            files.sort(key=sort_key)
+            # Sort by numeric index when available; plain "<n>.ts" names skip the regex
+            def segment_index(name: str) -> int:
+                stem = name[:-3]
+                if stem.isdigit():
+                    return int(stem)
+                m = _DIGITS_RE.search(name)
+                return int(m.group(1)) if m else 10**12
+            indexed = sorted((segment_index(name), name) for name in downloaded_files)
 
-            concat_ts_path = os.path.join(work_dir, f"{safe_basename}.ts")
             mp3_output_path = os.path.join(Config.DOWNLOAD_DIR, f"{safe_basename}.mp3")
 
-            try:
-                with open(concat_ts_path, 'wb') as out_f:
-                    for i, name in enumerate(files):
-                        seg_path = os.path.join(segments_dir, name)
-                        try:
-                            with open(seg_path, 'rb') as seg_f:
-                                while True:
-                                    chunk = seg_f.read(1024 * 512)
-                                    if not chunk:
-                                        break
-                                    out_f.write(chunk)
-                        except Exception as e:
-                            print(f"[yellow]Skipping unreadable segment {name}: {e}[/yellow]")
-                        if (i + 1) % 50 == 0 or (i + 1) == len(files):
-                            print(f"[cyan]Concatenated {i + 1}/{len(files)} segments[/cyan]", end='\r')
-            except Exception as e:
-                print(f"[bold red]Failed to concatenate segments:[/bold red] {e}")
-                _debug(f"stream_vod_from_m3u8: concat error {e}")
-                return None
-            print("\n[cyan]Converting concatenated TS to MP3 via ffmpeg...[/cyan]")
-            _debug(f"stream_vod_from_m3u8: launching ffmpeg for {concat_ts_path}")
-            ffmpeg_cmd = [
-                'ffmpeg', '-hide_banner', '-loglevel', 'error',
-                '-y',
-                '-i', concat_ts_path,
-                '-vn',
-                '-acodec', 'libmp3lame',
-                '-ab', '128k',
-                '-ar', '48000',
-                mp3_output_path
-            ]
-            try:
-                process = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-                stdout, stderr = process.communicate()
-                if process.returncode != 0:
-                    print(f"[bold red]ffmpeg failed ({process.returncode}).[/bold red]")
-                    if stderr:
-                        print(stderr)
-                    _debug(f"stream_vod_from_m3u8: ffmpeg failed ({process.returncode}) stderr={stderr}")
-                    return None
-                print(f"[bold green]MP3 saved:[/bold green] {mp3_output_path}")
-                _debug(f"stream_vod_from_m3u8: MP3 saved {mp3_output_path}")
-                return mp3_output_path
-            except FileNotFoundError:
-                print("[bold red]ffmpeg not found. Please install ffmpeg and ensure it is in PATH.[/bold red]")
-                _debug("stream_vod_from_m3u8: ffmpeg missing")
+            print("\n[cyan]Converting segments to MP3 via ffmpeg...[/cyan]")
+            _debug(f"stream_vod_from_m3u8: launching ffmpeg for {len(indexed)} segments")
+            segment_paths = [os.path.join(segments_dir, name) for _, name in indexed]
+            if not self._pipe_segments_to_mp3(segment_paths, mp3_output_path, show_progress=True):
                 return None
+            print(f"\n[bold green]MP3 saved:[/bold green] {mp3_output_path}")
+            _debug(f"stream_vod_from_m3u8: MP3 saved {mp3_output_path}")
+            return mp3_output_path
 
+        progress = _ProgressLine()
         end_reached = False
-        last_playlist_segment_count: Optional[int] = None
+        last_playlist_segment_count: Optional[int] = state.get("playlist_segment_count")
+        # Conditional GET validators (this run only: a 304 needs a parsed playlist to fall back on)
+        # and the highest media sequence with every earlier segment on disk
+        playlist_etag: Optional[str] = None
+        playlist_last_modified: Optional[str] = None
+        sequence_cursor = state.get("last_media_sequence", -1)
+        # Last parsed playlist, reused on 304 so segments that failed earlier are still retried
+        last_segs: Optional[List[Tuple[int, str, str]]] = None
+        gap_retry_polls = 0
         try:
             while True:
+                poll_headers = headers
+                # Validators only help once there is a parsed playlist to fall back on for a 304
+                if last_segs is not None and (playlist_etag or playlist_last_modified):
+                    poll_headers = dict(headers)
+                    if playlist_etag:
+                        poll_headers["If-None-Match"] = playlist_etag
+                    if playlist_last_modified:
+                        poll_headers["If-Modified-Since"] = playlist_last_modified
                 try:
                     if Config.DEBUG_HTTP:
                         print(f"[debug] GET {playlist_url}")
-                    resp = self._http_get(playlist_url, headers=headers, timeout=HTTP_TIMEOUT)
+                    resp = self._http_get(playlist_url, headers=poll_headers, timeout=HTTP_TIMEOUT)
                     if Config.DEBUG_HTTP:
                         print(f"[debug] -> HTTP {resp.status_code}")
                 except Exception as e:
@@ -448,35 +979,74 @@ class VodDownloader:
                     time.sleep(poll_seconds)
                     continue
 
-                if resp.status_code != 200:
-                    print(f"[yellow]Playlist HTTP {resp.status_code}. Retrying in {poll_seconds}s...[/yellow]")
+                with resp:
+                    status_code = resp.status_code
+                    if status_code == 200:
+                        playlist_etag = resp.headers.get("ETag")
+                        playlist_last_modified = resp.headers.get("Last-Modified")
+                        playlist_text = resp.text
+                if status_code == 304 and last_segs is not None:
+                    # Unchanged since the last poll: skip the parse, only missing segments get fetched
+                    _debug("stream_vod_from_m3u8: playlist not modified")
+                    segs = last_segs
+                    current_playlist_count = len(segs)
+                elif status_code != 200:
+                    print(f"[yellow]Playlist HTTP {status_code}. Retrying in {poll_seconds}s...[/yellow]")
                     time.sleep(poll_seconds)
                     continue
-
-                segs, ended = parse_playlist(resp.text)
-                current_playlist_count = len(segs)
-                # Determine new segments to fetch
-                new_segs = [(u, n) for (u, n) in segs if n not in downloaded_files]
+                else:
+                    segs, ended = _parse_m3u8(playlist_text, playlist_url) or ([], False)
+                    current_playlist_count = len(segs)
+                    last_segs = segs
+                # Determine new segments to fetch; the integer compare skips everything already covered,
+                # the set difference drops the rest that is already on disk in one C-level pass
+                pending_urls = {n: u for (seq, u, n) in segs if seq > sequence_cursor}
+                new_names = pending_urls.keys() - downloaded_files
+                new_segs = [(u, n) for n, u in pending_urls.items() if n in new_names] if new_names else []
                 if new_segs:
                     if not self.step_logger:
                         print(f"[cyan]New segments: {len(new_segs)}[/cyan]")
-                for idx, (seg_url, name) in enumerate(new_segs):
-                    local_path = os.path.join(segments_dir, name)
-                    ok = download_segment(seg_url, local_path)
-                    if ok:
-                        downloaded_files.add(name)
-                    if (idx + 1) % 10 == 0 or (idx + 1) == len(new_segs):
-                        if self.step_logger and seg_step_id:
-                            total = len(downloaded_files)
-                            self.step_logger.set_detail(seg_step_id, f"total: {total} (batch {idx + 1}/{len(new_segs)})")
-                        else:
-                            print(f"[green]Downloaded {idx + 1}/{len(new_segs)} new segments[/green]", end='\r')
+                    with ThreadPoolExecutor(max_workers=Config.SEGMENT_CONCURRENCY) as pool:
+                        futures = {
+                            pool.submit(download_segment, seg_url, os.path.join(segments_dir, name)): name
+                            for seg_url, name in new_segs
+                        }
+                        for idx, future in enumerate(as_completed(futures)):
+                            if future.result():
+                                downloaded_files.add(futures[future])
+                            if (idx + 1) % 10 == 0 or (idx + 1) == len(new_segs):
+                                if self.step_logger and seg_step_id:
+                                    total = len(downloaded_files)
+                                    self.step_logger.set_detail(seg_step_id, f"total: {total} (batch {idx + 1}/{len(new_segs)})")
+                                else:
+                                    progress.update(f"Downloaded {idx + 1}/{len(new_segs)} new segments", final=(idx + 1) == len(new_segs))
+                # Advance the cursor past the contiguous run of segments now on disk
+                for seq, _, name in segs:
+                    if seq <= sequence_cursor:
+                        continue
+                    if name not in downloaded_files:
+                        break
+                    sequence_cursor = seq
+
+                _save_stream_state(state_path, {
+                    "last_media_sequence": sequence_cursor,
+                    "playlist_segment_count": current_playlist_count,
+                    "segment_count": len(downloaded_files),
+                })
 
                 # Ignore ENDLIST, it's unreliable on Kick playlists
 
-                # New rule: if no increase in playlist segment count across polls, treat as ended
+                # New rule: if no increase in playlist segment count across polls, treat as ended.
+                # The cursor stops at the first missing segment, so a cursor short of the last
+                # listed sequence means gaps remain; those get a few more polls to heal
+                has_gaps = bool(segs) and segs[-1][0] > sequence_cursor
                 if last_playlist_segment_count is not None:
-                    if current_playlist_count <= last_playlist_segment_count:
+                    if current_playlist_count > last_playlist_segment_count:
+                        gap_retry_polls = 0
+                    elif has_gaps and gap_retry_polls < STREAM_GAP_RETRY_POLLS:
+                        gap_retry_polls += 1
+                        _debug(f"stream_vod_from_m3u8: playlist unchanged with missing segments, retry poll {gap_retry_polls}")
+                    else:
                         if self.step_logger and seg_step_id:
                             self.step_logger.complete_step(seg_step_id, detail=f"total: {len(downloaded_files)}")
                         print("\n[bold green]No new segments in latest poll. Assuming stream ended. Converting...[/bold green]")
@@ -516,6 +1086,15 @@ class VodDownloader:
         url = self._resolve_m3u8_from_channel_page(channel_name, preferred_variant, self._build_headers(referer=f"https://kick.com/{channel_name}"))
         return url
 
+    def _wait_for_page(self, script: str) -> None:
+        """Wait up to PAGE_READY_TIMEOUT for script to return truthy; a timeout just means parse what loaded."""
+        try:
+            # Script errors while the page is still navigating just mean "not ready yet"
+            WebDriverWait(self.driver, PAGE_READY_TIMEOUT, ignored_exceptions=(WebDriverException,)).until(
+                lambda d: d.execute_script(script))
+        except TimeoutException:
+            pass
+
     def _resolve_m3u8_from_channel_page(self, channel_name: str, preferred_variant: Optional[str], headers: Optional[dict] = None) -> Optional[str]:
         """
         Fallback: fetch https://kick.com/<channel> and look for any m3u8 URL in the HTML/embedded JSON.
@@ -526,7 +1105,7 @@ class VodDownloader:
         if self.driver:
             try:
                 self.driver.get(page_url)
-                time.sleep(2)
+                self._wait_for_page(_HTML_HAS_M3U8_JS)
                 html = self.driver.page_source
             except Exception as e:
                 html = None
@@ -545,7 +1124,7 @@ class VodDownloader:
             print(f"[yellow]Could not load channel page HTML for '{channel_name}'.[/yellow]")
             return None
         # Look for any .m3u8 URLs
-        m3u8_matches = re.findall(r'https?://[^"\']+\.m3u8', html)
+        m3u8_matches = _M3U8_SCAN_RE.findall(html)
         if not m3u8_matches:
             print("[yellow]No m3u8 found in channel page HTML.[/yellow]")
             return None
@@ -565,21 +1144,17 @@ class VodDownloader:
             target_url = f"https://kick.com/{channel_name}"
             try:
                 self.driver.get(target_url)
-                time.sleep(2)
+                # The in-page fetch only needs the document (and its cookies) in place
+                self._wait_for_page("return document.readyState === 'complete';")
             except Exception:
                 pass
 
             api_url = f"https://kick.com/api/v2/channels/{channel_name}"
-            script = f'''
-                return await fetch('{api_url}', {{ credentials: 'include' }})
-                  .then(r => r.ok ? r.json() : {{ status: r.status, error: 'HTTP ' + r.status }})
-                  .catch(e => ({{ error: e && e.message ? e.message : 'fetch error' }}));
-            '''
-            data = self.driver.execute_script(script)
+            data = self._browser_fetch_json(api_url)
             if not data or (isinstance(data, dict) and data.get('error')):
                 # Try to read any m3u8 from the current DOM as last resort
                 page_html = self.driver.page_source or ''
-                m3u8_matches = re.findall(r'https?://[^"\']+\.m3u8', page_html)
+                m3u8_matches = _M3U8_SCAN_RE.findall(page_html)
                 if m3u8_matches:
                     preferred = [u for u in m3u8_matches if 'stream.kick.com' in u]
                     candidate = preferred[0] if preferred else m3u8_matches[0]
@@ -590,92 +1165,128 @@ class VodDownloader:
             if not livestream:
                 return None
 
-            m3u8_urls: List[str] = []
-            def collect_urls(obj):
+            # Iterative DFS in document order; stops at the first preferred-variant URL
+            first_url: Optional[str] = None
+            stack = [livestream]
+            while stack:
+                obj = stack.pop()
                 if isinstance(obj, dict):
-                    for v in obj.values():
-                        collect_urls(v)
+                    stack.extend(reversed(obj.values()))
                 elif isinstance(obj, list):
-                    for v in obj:
-                        collect_urls(v)
-                elif isinstance(obj, str):
-                    if re.match(r'^https?://.+\.m3u8$', obj):
-                        m3u8_urls.append(obj)
-            collect_urls(livestream)
-
-            if not m3u8_urls:
+                    stack.extend(reversed(obj))
+                elif isinstance(obj, str) and _M3U8_URL_RE.match(obj):
+                    if preferred_variant and preferred_variant in obj:
+                        return obj
+                    if first_url is None:
+                        first_url = obj
+
+            if not first_url:
                 return None
-            if preferred_variant:
-                for u in m3u8_urls:
-                    if preferred_variant in u:
-                        return u
-            candidate = m3u8_urls[0]
-            return self._pick_variant_from_master(candidate, preferred_variant)
+            return self._pick_variant_from_master(first_url, preferred_variant)
         except Exception:
             return None
 
-    def get_latest_vod_link(self, channel_name: str) -> Optional[str]:
-        """Return the most recent VOD page URL for a channel."""
+    def get_latest_vod_link(self, channel_name: str, use_browser: bool = True) -> Optional[str]:
+        """
+        Return the most recent VOD page URL for a channel. use_browser=False goes straight to the
+        requests path, which reads only the first list item: a cheap probe that may be CF-blocked.
+        """
         try:
-            if self.driver:
+            if use_browser and self.driver:
                 vod_links = self.fetch_channel_vod_links(channel_name)
                 if vod_links:
                     return vod_links[0]
             # Fallback via requests
             api_url = f"https://kick.com/api/v2/channels/{channel_name}/videos?cursor=0&sort=date&time=all"
             headers = self._build_headers(referer=f"https://kick.com/{channel_name}")
-            resp = self._http_get(api_url, headers=headers, timeout=PLAYLIST_TIMEOUT)
-            if resp.status_code != 200:
-                return None
-            data = resp.json()
-            if not isinstance(data, list) or not data:
-                return None
-            for video_info in data:
-                if isinstance(video_info, dict) and 'video' in video_info and isinstance(video_info['video'], dict) and 'uuid' in video_info['video']:
-                    video_uuid = video_info['video']['uuid']
-                    return f"https://kick.com/{channel_name}/videos/{video_uuid}"
+            with self._http_get(api_url, headers=headers, timeout=PLAYLIST_TIMEOUT, stream=ijson is not None) as resp:
+                if resp.status_code != 200:
+                    return None
+                if ijson is not None:
+                    # Parse list items lazily and stop at the first usable one
+                    resp.raw.decode_content = True
+                    video_infos = ijson.items(resp.raw, 'item')
+                else:
+                    data = self._json(resp)
+                    if not isinstance(data, list):
+                        return None
+                    video_infos = data
+                for video_info in video_infos:
+                    if isinstance(video_info, dict) and 'video' in video_info and isinstance(video_info['video'], dict) and 'uuid' in video_info['video']:
+                        video_uuid = video_info['video']['uuid']
+                        return f"https://kick.com/{channel_name}/videos/{video_uuid}"
             return None
         except Exception:
             return None
 
+    @staticmethod
+    def _iter_m3u8_urls_streamed(resp) -> Iterator[str]:
+        """Yield m3u8 URLs from a streamed HTML response without materializing the whole page."""
+        tail = ''
+        for chunk in resp.iter_content(chunk_size=HTML_SCAN_CHUNK, decode_unicode=True):
+            if isinstance(chunk, bytes):
+                # No declared encoding: URLs are ASCII, so a lossy decode is fine
+                chunk = chunk.decode('utf-8', 'replace')
+            window = tail + chunk
+            for m in _M3U8_SCAN_RE.finditer(window):
+                # Matches ending inside the carried-over tail were yielded with the previous chunk
+                if m.end() > len(tail):
+                    yield m.group(0)
+            tail = window[-HTML_SCAN_OVERLAP:]
+
+    @staticmethod
+    def _select_m3u8_candidate(urls: Iterable[str], preferred_variant: Optional[str]) -> Optional[str]:
+        """
+        One pass by priority: preferred variant, then stream.kick.com host, then first match.
+        Stops consuming urls as soon as the outcome can no longer change.
+        """
+        first_match = host_match = None
+        for u in urls:
+            if preferred_variant and preferred_variant in u:
+                return u
+            if first_match is None:
+                first_match = u
+            if host_match is None and 'stream.kick.com' in u:
+                host_match = u
+                if not preferred_variant:
+                    break
+        return host_match or first_match
+
     def _resolve_m3u8_from_vod_page(self, vod_page_url: str, preferred_variant: Optional[str]) -> Optional[str]:
         """Fetch the VOD page and try to find any .m3u8, then pick variant. Use browser first to avoid CF."""
         html = None
         if self.driver:
             try:
                 self.driver.get(vod_page_url)
-                time.sleep(2)
+                self._wait_for_page(_HTML_HAS_M3U8_JS)
                 html = self.driver.page_source
             except Exception:
                 html = None
-        if not html:
+        if html:
+            candidate = self._select_m3u8_candidate(_M3U8_SCAN_RE.findall(html), preferred_variant)
+        else:
+            # Stream the page and stop reading once the candidate is settled
             headers = self._build_headers(referer=vod_page_url)
+            loaded = False
+            candidate = None
             try:
                 if Config.DEBUG_HTTP:
                     print(f"[debug] GET {vod_page_url}")
                     print(f"[debug] headers: {headers}")
-                r = self._http_get(vod_page_url, headers=headers, timeout=PAGE_TIMEOUT)
-                if Config.DEBUG_HTTP:
-                    print(f"[debug] -> HTTP {r.status_code}")
-                if r.status_code == 200:
-                    html = r.text
+                with self._http_get(vod_page_url, headers=headers, timeout=PAGE_TIMEOUT, stream=True) as r:
+                    if Config.DEBUG_HTTP:
+                        print(f"[debug] -> HTTP {r.status_code}")
+                    if r.status_code == 200:
+                        loaded = True
+                        candidate = self._select_m3u8_candidate(self._iter_m3u8_urls_streamed(r), preferred_variant)
             except Exception:
-                html = None
-        if not html:
-            print("[yellow]Could not load VOD page HTML.[/yellow]")
-            return None
+                candidate = None
+            if not loaded:
+                print("[yellow]Could not load VOD page HTML.[/yellow]")
+                return None
 
-        m3u8_matches = re.findall(r'https?://[^"\']+\.m3u8', html)
-        if not m3u8_matches:
+        if not candidate:
             return None
-        # Prefer stream.kick.com host
-        preferred_hosts = [u for u in m3u8_matches if 'stream.kick.com' in u]
-        candidate = preferred_hosts[0] if preferred_hosts else m3u8_matches[0]
-        if preferred_variant:
-            for u in m3u8_matches:
-                if preferred_variant in u:
-                    candidate = u
-                    break
         return self._pick_variant_from_master(candidate, preferred_variant)
 
     def get_latest_vod_m3u8_for_channel(self, channel_name: str, preferred_variant: Optional[str] = None, require_live: bool = False) -> Optional[str]:
@@ -695,10 +1306,19 @@ class VodDownloader:
             print(f"[yellow]No VODs found for '{channel_name}'.[/yellow]")
             return None
         print(f"[cyan]Latest VOD URL:[/cyan] {vod_url}")
+        # JSON API first (UUID -> v1 video 'source'); scraping the page HTML is the fallback
+        uuid = self._parse_uuid_from_vod_url(vod_url)
+        master = self.get_video_master_m3u8_by_uuid(uuid) if uuid else None
+        if master:
+            return self._pick_variant_from_master(master, preferred_variant)
         return self._resolve_m3u8_from_vod_page(vod_url, preferred_variant)
 
     def _pick_variant_from_master(self, playlist_url: str, preferred_variant: Optional[str]) -> Optional[str]:
         """If playlist_url is a master playlist, try to select a variant based on preference or bandwidth."""
+        # ".../<variant>/playlist.m3u8" (e.g. 480p30) is already a media playlist: a fetch would return it unchanged
+        path_parts = urlparse(playlist_url).path.rsplit('/', 2)
+        if len(path_parts) == 3 and path_parts[2] == 'playlist.m3u8' and _VARIANT_RE.match(path_parts[1]):
+            return playlist_url
         headers = {"User-Agent": "Mozilla/5.0"}
         try:
             if Config.DEBUG_HTTP:
@@ -716,58 +1336,66 @@ class VodDownloader:
             return playlist_url
 
         base_url = playlist_url.rsplit('/', 1)[0]
-        # Parse master variants: (#EXT-X-STREAM-INF ... next line is the uri)
-        variants: List[Tuple[Optional[int], str]] = []
-        lines = [line.strip() for line in text.splitlines()]
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            if line.startswith('#EXT-X-STREAM-INF'):
-                bandwidth = None
-                m = re.search(r'BANDWIDTH=(\d+)', line)
-                if m:
-                    try:
-                        bandwidth = int(m.group(1))
-                    except Exception:
-                        bandwidth = None
-                # Next non-empty, non-comment line is the URL
-                j = i + 1
-                while j < len(lines) and (not lines[j] or lines[j].startswith('#')):
-                    j += 1
-                if j < len(lines):
-                    uri = lines[j]
-                    if not re.match(r'^https?://', uri):
-                        uri = f"{base_url}/{uri}"
-                    variants.append((bandwidth, uri))
-                    i = j
-            i += 1
-
-        if not variants:
-            return playlist_url
-
-        # Preferred substring match first
-        if preferred_variant:
-            for _, uri in variants:
-                if preferred_variant in uri:
-                    return uri
-
-        # Otherwise pick highest bandwidth available
-        variants.sort(key=lambda t: (t[0] or 0), reverse=True)
-        return variants[0][1]
+        # Parse master variants: (#EXT-X-STREAM-INF ... next line is the uri),
+        # keeping only the highest-bandwidth one seen so far
+        best_bandwidth = -1
+        best_uri: Optional[str] = None
+        lines = iter(text.splitlines())
+        for line in lines:
+            line = line.strip()
+            if not line.startswith('#EXT-X-STREAM-INF'):
+                continue
+            m = _BANDWIDTH_RE.search(line)
+            bandwidth = int(m.group(1)) if m else 0
+            # Next non-empty, non-comment line is the URL; the shared iterator resumes after it
+            for uri in lines:
+                uri = uri.strip()
+                if uri and not uri.startswith('#'):
+                    break
+            else:
+                break
+            if not _ABS_URL_RE.match(uri):
+                uri = f"{base_url}/{uri}"
+            # Preferred substring match wins as soon as it is seen
+            if preferred_variant and preferred_variant in uri:
+                return uri
+            if bandwidth > best_bandwidth:
+                best_bandwidth, best_uri = bandwidth, uri
+
+        # Otherwise the highest bandwidth available
+        return best_uri or playlist_url
 
     def _parse_uuid_from_vod_url(self, vod_url: str) -> Optional[str]:
+        # Module-level cache: lru_cache on the method would pin self alive
         try:
-            parts = vod_url.rstrip('/').split('/')
-            return parts[-1] if parts else None
+            return _parse_uuid(vod_url)
         except Exception:
             return None
 
-    def get_video_master_m3u8_by_uuid(self, video_uuid: str) -> Optional[str]:
-        """Use browser JS fetch to query Kick v1 video API and return 'source' (master m3u8)."""
+    def _get_video_json_by_uuid(self, video_uuid: str) -> Optional[dict]:
+        """
+        Full v1 video API JSON for a UUID, fetched once per downloader. Uses the browser's JS fetch
+        (credentials, bypasses CF) when available, falling back to requests.
+        """
         if not video_uuid:
             return None
+        cached = self._video_json_cache.get(video_uuid)
+        if cached is not None:
+            return cached
         api_url = f"https://kick.com/api/v1/video/{video_uuid}"
-        if not self.driver:
+        data = None
+        if self.driver:
+            try:
+                data = self._browser_fetch_json(api_url)
+                error = data.get('error') if isinstance(data, dict) else None
+                if Config.DEBUG_HTTP:
+                    print(f"[debug] JS fetch {api_url} -> {error or 'ok'}")
+                if error:
+                    # Let the requests fallback below have a go
+                    data = None
+            except Exception:
+                return None
+        if not isinstance(data, dict):
             # Fallback to requests (may be blocked by CF)
             try:
                 headers = self._build_headers(referer=f"https://kick.com/video/{video_uuid}")
@@ -778,58 +1406,26 @@ class VodDownloader:
                     print(f"[debug] -> HTTP {r.status_code}")
                 if r.status_code != 200:
                     return None
-                data = r.json()
-                return data.get('source')
+                data = self._json(r)
             except Exception:
                 return None
-        # Use Selenium to bypass CF
-        try:
-            script = f"""
-                return await fetch('{api_url}', {{ credentials: 'include' }})
-                  .then(r => r.ok ? r.json() : null)
-                  .catch(_ => null);
-            """
-            data = self.driver.execute_script(script)
-            if Config.DEBUG_HTTP:
-                print(f"[debug] JS fetch {api_url} -> {'ok' if data else 'null'}")
-            if isinstance(data, dict) and data.get('source'):
-                return data['source']
-            return None
-        except Exception:
+        if not isinstance(data, dict):
             return None
+        if not data.get('source'):
+            # Not playable yet (e.g. still processing): don't pin that state for later polls
+            return data
+        self._video_json_cache[video_uuid] = data
+        while len(self._video_json_cache) > VIDEO_JSON_CACHE_SIZE:
+            self._video_json_cache.popitem(last=False)
+        return data
+
+    def get_video_master_m3u8_by_uuid(self, video_uuid: str) -> Optional[str]:
+        """Query Kick v1 video API and return 'source' (master m3u8)."""
+        return (self._get_video_json_by_uuid(video_uuid) or {}).get('source')
 
     def get_video_metadata_by_uuid(self, video_uuid: str) -> Optional[dict]:
         """Return full JSON from v1 video API using browser (credentials) when possible."""
-        if not video_uuid:
-            return None
-        api_url = f"https://kick.com/api/v1/video/{video_uuid}"
-        if self.driver:
-            try:
-                script = f"""
-                    return await fetch('{api_url}', {{ credentials: 'include' }})
-                      .then(r => r.ok ? r.json() : null)
-                      .catch(_ => null);
-                """
-                data = self.driver.execute_script(script)
-                if Config.DEBUG_HTTP:
-                    print(f"[debug] JS fetch {api_url} -> {'ok' if data else 'null'}")
-                if isinstance(data, dict):
-                    return data
-            except Exception:
-                return None
-        # Fallback to requests (may be blocked)
-        try:
-            headers = self._build_headers(referer=f"https://kick.com/video/{video_uuid}")
-            if Config.DEBUG_HTTP:
-                print(f"[debug] GET {api_url}\n[debug] headers: {headers}")
-            r = self._http_get(api_url, headers=headers, timeout=PLAYLIST_TIMEOUT)
-            if Config.DEBUG_HTTP:
-                print(f"[debug] -> HTTP {r.status_code}")
-            if r.status_code != 200:
-                return None
-            return r.json()
-        except Exception:
-            return None
+        return self._get_video_json_by_uuid(video_uuid)
 
     def build_suggested_basename(self, channel_name: str, video_data: Optional[dict], preferred_variant: Optional[str]) -> str:
         """Build a descriptive basename like 'channel_YYYY-MM-DD_HH-mm_480p'."""
@@ -839,21 +1435,22 @@ class VodDownloader:
             if not ts and isinstance(video_data.get('livestream'), dict):
                 ts = video_data['livestream'].get('start_time')
             if isinstance(ts, str):
-                try:
-                    iso = ts.replace('Z', '+00:00')
-                    dt = datetime.datetime.fromisoformat(iso)
-                    date_str = dt.strftime('%Y-%m-%d_%H-%M')
-                except Exception:
-                    pass
+                if len(ts) >= 16 and ts[4] == ts[7] == '-' and ts[10] in 'T ' and ts[13] == ':':
+                    # "YYYY-MM-DD[T ]HH:MM..." already holds the fields; no datetime round trip needed
+                    date_str = f"{ts[:10]}_{ts[11:13]}-{ts[14:16]}"
+                else:
+                    try:
+                        iso = ts.replace('Z', '+00:00')
+                        dt = datetime.datetime.fromisoformat(iso)
+                        date_str = dt.strftime('%Y-%m-%d_%H-%M')
+                    except Exception:
+                        pass
         if not date_str:
-            try:
-                date_str = datetime.datetime.utcnow().strftime('%Y-%m-%d_%H-%M')
-            except Exception:
-                date_str = 'unknown-date'
+            date_str = time.strftime('%Y-%m-%d_%H-%M', time.gmtime())
 
         variant_label = None
         if preferred_variant:
-            m = re.match(r'^(\d+p)', str(preferred_variant))
+            m = _VARIANT_RE.match(str(preferred_variant))
             if m:
                 variant_label = m.group(1)
             else:
@@ -861,8 +1458,7 @@ class VodDownloader:
         else:
             variant_label = '480p'
 
-        raw = f"{channel_name}_{date_str}_{variant_label}"
-        return re.sub(r'[^A-Za-z0-9_.\-]+', '_', raw)
+        return _sanitize_name(f"{channel_name}_{date_str}_{variant_label}")
 
     def _derive_variant_from_master_url(self, master_url: str, preferred_variant: Optional[str]) -> Optional[str]:
         """If master fetch fails, try building variant URL from known IVS path pattern."""
@@ -904,43 +1500,35 @@ class VodDownloader:
             print(f"[debug] master: {master}\n[debug] variant: {variant}")
         return variant, vod_url
 
+    def resolve_many(self, channel_names: Iterable[str], preferred_variant: Optional[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Run get_latest_vod_variant_m3u8 for several channels concurrently. Workers take the
+        requests-based paths only, since the Selenium driver can't be shared across threads.
+        """
+        def resolve(channel_name: str) -> Tuple[Optional[str], Optional[str]]:
+            self._thread_state.driverless = True
+            try:
+                return self.get_latest_vod_variant_m3u8(channel_name, preferred_variant)
+            except Exception as e:
+                _debug(f"resolve_many: {channel_name} failed: {e}")
+                return None, None
+            finally:
+                self._thread_state.driverless = False
+
+        names = list(dict.fromkeys(channel_names))
+        if not names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(RESOLVE_CONCURRENCY, len(names))) as pool:
+            return dict(zip(names, pool.map(resolve, names)))
+
 
     def is_channel_live(self, channel_name: str) -> bool:
         api_url = f"https://kick.com/api/v2/channels/{channel_name}"
-        # Make the JS robust against fetch errors and non-JSON responses
-        script = f'''
-            return await fetch('{api_url}')
-                .then(response => {{
-                    if (!response.ok) {{
-                        // console.warn(`Liveness check HTTP error for {channel_name}: ${{response.status}}`);
-                        return {{ error: `HTTP error! status: ${{response.status}}`, is_live: false, from_script: true }};
-                    }}
-                    return response.json();
-                }})
-                .then(data => {{
-                    if (data && typeof data.livestream !== 'undefined' && data.livestream !== null) {{
-                        return {{ is_live: true, from_script: true }}; // data.livestream could contain more info if needed
-                    }}
-                    return {{ is_live: false, from_script: true }}; // No livestream object or it's null
-                }})
-                .catch(e => {{
-                    // console.error('Liveness check fetch API Error in script for {channel_name}:', e);
-                    return {{ error: e.message, is_live: false, from_script: true }};
-                }});
-        '''
         try:
-            response_data = self.driver.execute_script(script)
-
-            if isinstance(response_data, dict) and response_data.get('from_script'):
-                if 'error' in response_data and response_data['error']:
-                    # Optional: log detailed error if needed, but console spam should be avoided here
-                    # self.console.print(f"[yellow]API error during liveness check for '{channel_name}': {response_data['error']}[/yellow]")
-                    pass
-                return bool(response_data.get('is_live', False))
-            else:
-                # self.console.print(f"[yellow]Liveness check for '{channel_name}': Unexpected script response format.[/yellow]")
-                # self.file_manager.save_debug_info(self.driver, prefix="liveness_check_bad_response", vod_url=channel_name)
-                return False # Safer to assume not live
+            data = self._browser_fetch_json(api_url)
+            if not isinstance(data, dict) or data.get('error'):
+                return False
+            return data.get('livestream') is not None
 
         except WebDriverException as e:
             # self.console.print(f"[red]WebDriver Error during liveness check for {channel_name}: {e}[/red]")
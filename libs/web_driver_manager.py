@@ -1,22 +1,222 @@
+import json
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 
 from .config import Config
 
+# Resolved chromedriver path is cached across runs so webdriver_manager's remote lookup is skipped
+DRIVER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "kick-vod-downloader")
+DRIVER_CACHE_FILE = os.path.join(DRIVER_CACHE_DIR, "chromedriver_path.json")
+DRIVER_CACHE_TTL = 7 * 24 * 3600  # seconds
+
+# Persistent browser: one Chrome outlives the process and later runs attach to it over CDP
+BROWSER_STATE_FILE = os.path.join(DRIVER_CACHE_DIR, "chrome_session.json")
+BROWSER_LOCK_FILE = os.path.join(DRIVER_CACHE_DIR, "chrome_session.lock")
+BROWSER_PROFILE_DIR = os.path.join(DRIVER_CACHE_DIR, "chrome-profile")
+BROWSER_START_TIMEOUT = 20  # seconds to wait for Chrome to publish its DevTools port
+BROWSER_LOCK_TIMEOUT = 30  # seconds to wait for another process launching the browser
+BROWSER_LOCK_STALE = 60  # a lock older than this is left over from a crashed run
+
+_CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+_CHROME_MAJOR_RE = re.compile(r'(\d+)\.')
+
+
+
+def _iter_chrome_binaries():
+    for name in _CHROME_BINARIES:
+        binary = shutil.which(name) or (name if os.path.isabs(name) and os.path.exists(name) else None)
+        if binary:
+            yield binary
+
+
+@lru_cache(maxsize=1)
+def _chrome_major_version() -> Optional[str]:
+    """
+    Major version of the installed Chrome, or None if it can't be determined (e.g. on Windows).
+    Checked once per process: auto_runner calls setup() once per channel.
+    """
+    if sys.platform.startswith("win"):
+        return None
+    for binary in _iter_chrome_binaries():
+        try:
+            result = subprocess.run([binary, "--version"], stdin=subprocess.DEVNULL, capture_output=True, timeout=5, check=False)
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        m = _CHROME_MAJOR_RE.search(result.stdout.decode("utf-8", "replace"))
+        if m:
+            return m.group(1)
+    return None
+
+
+def _load_cached_driver_path(chrome_major: Optional[str]) -> Optional[str]:
+    try:
+        with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    path = cached.get("path")
+    if not path or not os.path.exists(path):
+        return None
+    if time.time() - cached.get("ts", 0) > DRIVER_CACHE_TTL:
+        return None
+    if cached.get("chrome_major") != chrome_major:
+        return None
+    return path
+
+
+def _save_cached_driver_path(path: str, chrome_major: Optional[str]) -> None:
+    try:
+        os.makedirs(DRIVER_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{DRIVER_CACHE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"path": path, "chrome_major": chrome_major, "ts": time.time()}, f)
+        os.replace(tmp_path, DRIVER_CACHE_FILE)
+    except OSError:
+        # Caching is best-effort; the next run just resolves the driver again
+        pass
+
+
+def _resolve_chromedriver_path() -> str:
+    chrome_major = _chrome_major_version()
+    path = _load_cached_driver_path(chrome_major)
+    if path:
+        return path
+    path = ChromeDriverManager().install()
+    _save_cached_driver_path(path, chrome_major)
+    return path
+
+
+@contextmanager
+def _browser_lock():
+    """Cross-process lock so concurrent runs don't each launch a persistent browser."""
+    os.makedirs(DRIVER_CACHE_DIR, exist_ok=True)
+    deadline = time.monotonic() + BROWSER_LOCK_TIMEOUT
+    while True:
+        try:
+            fd = os.open(BROWSER_LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(BROWSER_LOCK_FILE) > BROWSER_LOCK_STALE:
+                    os.remove(BROWSER_LOCK_FILE)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {BROWSER_LOCK_FILE}")
+            time.sleep(0.2)
+    try:
+        os.close(fd)
+        yield
+    finally:
+        try:
+            os.remove(BROWSER_LOCK_FILE)
+        except OSError:
+            pass
+
+
+def _load_browser_state() -> Optional[dict]:
+    try:
+        with open(BROWSER_STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or not state.get("debugger_address"):
+        return None
+    return state
+
+
+def _debugger_alive(address: str) -> bool:
+    """True if a browser is answering on the DevTools endpoint (also guards against reused pids)."""
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=2) as resp:
+            return resp.status == 200
+    except (OSError, ValueError):
+        return False
+
+
+def _launch_persistent_browser() -> dict:
+    """Start a detached Chrome with remote debugging on a free port and record where to find it."""
+    binary = next(_iter_chrome_binaries(), None)
+    if not binary:
+        raise RuntimeError("Chrome binary not found for persistent browser mode")
+    port_file = os.path.join(BROWSER_PROFILE_DIR, "DevToolsActivePort")
+    try:
+        os.remove(port_file)
+    except OSError:
+        pass
+    # Command-line switches carry over; experimental options only apply to driver-launched browsers
+    args = [binary, "--remote-debugging-port=0", f"--user-data-dir={BROWSER_PROFILE_DIR}"]
+    args.extend(f"--{a.lstrip('-')}" for a in Config.get_chrome_options().arguments)
+    popen_kwargs = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+    if sys.platform.startswith("win"):
+        popen_kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        popen_kwargs["start_new_session"] = True
+    proc = subprocess.Popen(args, **popen_kwargs)
+
+    # Port 0 lets Chrome pick a free port; it writes the choice to DevToolsActivePort
+    deadline = time.monotonic() + BROWSER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Chrome exited during startup (code {proc.returncode})")
+        try:
+            with open(port_file, "r", encoding="utf-8") as f:
+                port = f.readline().strip()
+        except OSError:
+            port = ""
+        if port.isdigit():
+            state = {"pid": proc.pid, "debugger_address": f"127.0.0.1:{port}"}
+            tmp_path = f"{BROWSER_STATE_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, BROWSER_STATE_FILE)
+            return state
+        time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("Chrome did not publish a DevTools port in time")
+
+
 class WebDriverManager:
     def __init__(self, console: Console):
         self.console = console
 
-    def setup(self) -> Optional[RemoteWebDriver]:
+    def setup(self, persistent: Optional[bool] = None) -> Optional[RemoteWebDriver]:
         # self.console.print(Panel("[bold cyan]Setting up WebDriver...[/bold cyan]", title="Setup", border_style="blue"))
+        if persistent is None:
+            persistent = Config.PERSISTENT_BROWSER
+        if persistent:
+            driver = self._setup_persistent()
+            if driver:
+                return driver
         try:
             # Primary path: use webdriver_manager to fetch a matching ChromeDriver
-            service = ChromeService(ChromeDriverManager().install())
+            service = ChromeService(_resolve_chromedriver_path())
             driver = webdriver.Chrome(service=service, options=Config.get_chrome_options())
             driver.implicitly_wait(5)
             # self.console.print("[green]WebDriver setup complete.[/green]")
@@ -32,9 +232,42 @@ class WebDriverManager:
                 self.console.print(f"[bold red]Fatal Error during WebDriver setup:[/bold red] {fallback_e}")
                 return None
 
+    def _setup_persistent(self) -> Optional[RemoteWebDriver]:
+        """Attach to the shared Chrome, launching it first if none is running."""
+        try:
+            with _browser_lock():
+                state = _load_browser_state()
+                if not state or not _debugger_alive(state["debugger_address"]):
+                    state = _launch_persistent_browser()
+            options = Options()
+            options.add_experimental_option("debuggerAddress", state["debugger_address"])
+            driver = webdriver.Chrome(service=ChromeService(_resolve_chromedriver_path()), options=options)
+            driver.implicitly_wait(5)
+            return driver
+        except Exception as e:
+            self.console.print(f"[yellow]Persistent browser unavailable, launching a private one…[/yellow] ({e})")
+            return None
+
     def close(self, driver: RemoteWebDriver):
         self.console.print("\n[cyan]Closing WebDriver...[/cyan]")
         try:
+            # An attached (debuggerAddress) session only detaches; the shared browser keeps running
             driver.quit()
         except Exception as quit_e:
             self.console.print(f"[yellow]Warning: Error during WebDriver quit:[/yellow] {quit_e}")
+
+    def kill_persistent(self) -> bool:
+        """Terminate the shared browser, if one is running. Returns True if one was stopped."""
+        state = _load_browser_state()
+        stopped = False
+        if state and state.get("pid") and _debugger_alive(state["debugger_address"]):
+            try:
+                os.kill(int(state["pid"]), signal.SIGTERM)
+                stopped = True
+            except (OSError, ValueError) as e:
+                self.console.print(f"[yellow]Warning: Could not stop persistent browser:[/yellow] {e}")
+        try:
+            os.remove(BROWSER_STATE_FILE)
+        except OSError:
+            pass
+        return stopped